@@ -1,17 +1,19 @@
 import streamlit as st
-import pandas as pd
 from datetime import date as dt_date
 
+from expense_core.ledger import Ledger
+
 st.set_page_config(page_title="My Monthly Expense Diary", layout="centered")
 st.title("💸 My Monthly Expense Diary")
 
 st.markdown("Record your purchases and expenses – keep track, even on vacation ☀️")
 
-# --- Initialize DataFrame ---
+# --- Initialize ledger ---
 if "data" not in st.session_state:
-    st.session_state.data = pd.DataFrame(columns=[
-        "Date", "Shop", "Country", "Currency", "Amount", "Category", "Note", "Converted_CZK"
-    ])
+    st.session_state.data = Ledger(schema={
+        "Date": "date", "Shop": "text", "Country": "category", "Currency": "category",
+        "Amount": "money", "Category": "category", "Note": "text", "Converted_CZK": "money"
+    })
 
 # --- Input Form ---
 st.subheader("➕ Add Purchase")
@@ -59,24 +61,21 @@ with st.form("input_form"):
             "Note": note,
             "Converted_CZK": round(converted, 2)
         }
-        st.session_state.data = pd.concat(
-            [st.session_state.data, pd.DataFrame([new_record])],
-            ignore_index=True
-        )
+        st.session_state.data.append(new_record)
         st.success("✅ Purchase has been added!")
 
 # --- Display Table ---
 st.subheader("📊 List of Purchases")
-st.dataframe(st.session_state.data, use_container_width=True)
+st.dataframe(st.session_state.data.to_frame(), use_container_width=True)
 
 # --- Calculations ---
 st.subheader("📈 Monthly Expense Summary")
 
-data = st.session_state.data
+data = st.session_state.data.to_frame()
 
 if not data.empty:
     total_sum = data["Converted_CZK"].sum()
-    category_summary = data.groupby("Category")["Converted_CZK"].sum()
+    category_summary = data.groupby("Category", observed=True)["Converted_CZK"].sum()
 
     for cat, amt in category_summary.items():
         st.markdown(f"**{cat}:** {amt:.2f} CZK")
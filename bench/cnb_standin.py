@@ -0,0 +1,110 @@
+"""Local stand-in for the CNB TXT feeds, built from bench/fixtures/.
+
+Answers `denni_kurz.txt` (optionally `?date=DD.MM.YYYY`) with the daily
+fixture re-dated to the requested business day, and `rok.txt?rok=YYYY`
+with the 2024 yearly fixture moved to that year, up to today. Responses
+carry an ETag and honour If-None-Match, like cnb.cz, so FeedCache's
+revalidation path is exercised too. Setting `server.fail` to a
+(status, body) pair answers every request with it, as during an outage.
+
+    python bench/cnb_standin.py 8765     # then CNB_BASE_URL=http://127.0.0.1:8765/
+"""
+import hashlib
+import http.server
+import os
+import sys
+import threading
+from datetime import date as dt_date, datetime, timedelta
+from urllib.parse import parse_qs, urlparse
+
+FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+
+def _fixture(name: str) -> str:
+    with open(os.path.join(FIXTURES, name), encoding="utf-8") as f:
+        return f.read()
+
+
+DAILY = _fixture("denni_kurz.txt")
+YEARLY = _fixture("rok-2024.txt")
+
+
+def daily_feed(d: dt_date) -> str:
+    """The daily fixture as CNB would publish it for `d` (weekends -> Friday)."""
+    while d.weekday() >= 5:
+        d -= timedelta(days=1)
+    return f"{d:%d.%m.%Y}" + DAILY[10:]
+
+
+def yearly_feed(year: int, today: dt_date = None) -> str:
+    """The yearly fixture moved to `year`, without days after `today`."""
+    today = today or dt_date.today()
+    header, *rows = YEARLY.splitlines()
+    out = [header]
+    for row in rows:
+        try:
+            day = datetime.strptime(row[:10], "%d.%m.%Y").date().replace(year=year)
+        except ValueError:      # 29.02 outside leap years
+            continue
+        if day <= today:
+            out.append(f"{day:%d.%m.%Y}" + row[10:])
+    return "\n".join(out) + "\n"
+
+
+class _Handler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        query = parse_qs(url.query)
+        self.server.hits += 1
+        if self.server.fail is not None:
+            status, body = self.server.fail
+            self._send(status, body.encode("utf-8"), "text/html; charset=UTF-8")
+            return
+        if url.path.endswith("rok.txt"):
+            body = yearly_feed(int(query["rok"][0]))
+        elif "date" in query:
+            body = daily_feed(datetime.strptime(query["date"][0], "%d.%m.%Y").date())
+        else:
+            body = daily_feed(dt_date.today())
+        data = body.encode("utf-8")
+        etag = '"%s"' % hashlib.sha1(data).hexdigest()[:16]
+        if self.headers.get("If-None-Match") == etag:
+            self._send(304, b"", etag=etag)
+        else:
+            self._send(200, data, "text/plain; charset=UTF-8", etag)
+
+    def _send(self, status: int, data: bytes, content_type: str = None, etag: str = None):
+        self.server.log.append((self.path, status))
+        self.send_response(status)
+        if content_type:
+            self.send_header("Content-Type", content_type)
+        if etag:
+            self.send_header("ETag", etag)
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+
+def start(port: int = 0):
+    """Serve in a daemon thread; returns (server, base URL).
+
+    `server.hits` counts requests and `server.log` lists (path, status) of
+    each answer.
+    """
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", port), _Handler)
+    server.hits = 0
+    server.log = []
+    server.fail = None
+    threading.Thread(target=server.serve_forever, name="cnb-standin", daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}/"
+
+
+if __name__ == "__main__":
+    _, url = start(int(sys.argv[1]) if len(sys.argv) > 1 else 8765)
+    print(url, flush=True)
+    threading.Event().wait()
@@ -0,0 +1,210 @@
+"""Multi-session load harness for the Streamlit apps, on streamlit.testing's AppTest.
+
+Every simulated session is its own AppTest (own session state, widgets
+and fragments) running the real script against a shared SQLite file and
+the local CNB stand-in (cnb_standin.py). Each iteration a session saves
+a purchase, switches language, changes the export format and downloads
+the export (the deferred download callable, exactly what a click runs).
+
+AppTest swaps a process-global runtime in and out around every run, so
+the sessions of one worker process take turns rerun by rerun, the way a
+single server's script threads share the GIL; st.cache_resource objects
+are shared between them as on a server. `--workers` runs that many such
+processes side by side, like server replicas behind a load balancer.
+
+Prints one JSON object: per-step latency percentiles (ms), reruns/s and
+the peak RSS of each worker.
+
+    python bench/load.py --sessions 20 --iterations 5
+    python bench/load.py vytah_test_app.py --sessions 40 --workers 4 --seed-rows 10000
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import random
+import resource
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from datetime import date as dt_date, timedelta
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+STEPS = ("open", "save", "language", "export_format", "download")
+
+
+def _percentiles(values: list) -> dict:
+    values = sorted(values)
+
+    def pick(q):
+        return round(values[min(len(values) - 1, int(q * len(values)))] * 1000, 2)
+
+    return {
+        "n": len(values),
+        "mean": round(statistics.fmean(values) * 1000, 2),
+        "p50": pick(0.5), "p90": pick(0.9), "p99": pick(0.99),
+        "max": round(values[-1] * 1000, 2),
+    }
+
+
+def _record_downloads():
+    """Remember every deferred download callable by file id (AppTest drops its media manager)."""
+    from streamlit.runtime.media_file_manager import MediaFileManager
+
+    callables = {}
+    register = MediaFileManager.add_deferred
+
+    def add_deferred(self, data_callable, *args, **kwargs):
+        file_id = register(self, data_callable, *args, **kwargs)
+        callables[file_id] = data_callable
+        return file_id
+
+    MediaFileManager.add_deferred = add_deferred
+    return callables
+
+
+class Session:
+    def __init__(self, app: str, seed: int, timings: dict, downloads: dict):
+        from streamlit.testing.v1 import AppTest
+
+        self.at = AppTest.from_file(app, default_timeout=120)
+        self.rng = random.Random(seed)
+        self.timings = timings
+        self.downloads = downloads
+        self.errors = 0
+        self._timed("open", self.at.run)
+
+    def _timed(self, step: str, fn):
+        t = time.perf_counter()
+        fn()
+        self.timings[step].append(time.perf_counter() - t)
+        if self.at.exception:
+            self.errors += 1
+
+    def save(self):
+        # Form widgets have no keys: language is the first selectbox, then country, category
+        at, rng = self.at, self.rng
+        at.date_input[0].set_value(dt_date(2025, 1, 1) + timedelta(days=rng.randrange(365)))
+        country = at.selectbox[1]
+        country.set_value(rng.choice(country.options))
+        category = at.selectbox[2]
+        category.set_value(rng.choice(category.options))
+        at.number_input[0].set_value(round(rng.uniform(1, 2000), 2))
+        at.button[0].click()
+        self._timed("save", at.run)
+
+    def switch_language(self):
+        lang = self.at.selectbox[0]
+        lang.set_value(lang.options[1] if lang.value == lang.options[0] else lang.options[0])
+        self._timed("language", self.at.run)
+
+    def export(self):
+        at = self.at
+        fmt = at.selectbox(key="export_format")
+        fmt.set_value(self.rng.choice(fmt.options))
+        self._timed("export_format", at.run)
+        button = at.get("download_button")[0]
+        build = self.downloads.pop(button.proto.deferred_file_id)
+        t = time.perf_counter()
+        build()
+        self.timings["download"].append(time.perf_counter() - t)
+
+    def iterate(self):
+        self.save()
+        self.switch_language()
+        self.export()
+
+
+def worker(app: str, sessions: int, iterations: int, seed: int) -> dict:
+    downloads = _record_downloads()
+    timings = {step: [] for step in STEPS}
+    t = time.perf_counter()
+    pool = [Session(app, seed + i, timings, downloads) for i in range(sessions)]
+    for _ in range(iterations):
+        for session in pool:
+            session.iterate()
+            # Deferred callables of reruns nobody clicked on are not needed
+            downloads.clear()
+    wall = time.perf_counter() - t
+    return {
+        "timings": timings,
+        "wall_s": wall,
+        "errors": sum(s.errors for s in pool),
+        "peak_rss_mb": round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1),
+    }
+
+
+def _seed_db(path: str, rows: int):
+    sys.path.insert(0, os.path.join(ROOT, "bench"))
+    sys.path.insert(0, ROOT)
+    from expense_core.storage import ExpenseStore
+    from suite import synthetic_frame
+
+    store = ExpenseStore(path)
+    store.insert_many(synthetic_frame(rows).to_dict("records"))
+    store.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("app", nargs="?", default="CNB_test_app.py")
+    parser.add_argument("--sessions", type=int, default=10)
+    parser.add_argument("--iterations", type=int, default=3)
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--seed-rows", type=int, default=1000, help="purchases in the database before the run")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    sys.path.insert(0, os.path.join(ROOT, "bench"))
+    import cnb_standin
+
+    server, base_url = cnb_standin.start()
+    tmp = tempfile.mkdtemp(prefix="bench-load-")
+    try:
+        db = os.path.join(tmp, "expenses.db")
+        if args.seed_rows:
+            _seed_db(db, args.seed_rows)
+        # Inherited by the workers, read by the apps at import
+        os.environ.update(
+            EXPENSES_DB=db,
+            CNB_CACHE_DIR=os.path.join(tmp, "cnb"),
+            HOLIDAY_CACHE_DIR=os.path.join(tmp, "holidays"),
+            CNB_BASE_URL=base_url,
+        )
+        app = os.path.join(ROOT, args.app)
+        per_worker = [args.sessions // args.workers + (i < args.sessions % args.workers)
+                      for i in range(args.workers)]
+        jobs = [(app, n, args.iterations, args.seed + 1000 * i) for i, n in enumerate(per_worker) if n]
+        with multiprocessing.get_context("spawn").Pool(len(jobs)) as pool:
+            results = pool.starmap(worker, jobs)
+    finally:
+        server.shutdown()
+        shutil.rmtree(tmp, ignore_errors=True)
+
+    timings = {step: [x for r in results for x in r["timings"][step]] for step in STEPS}
+    reruns = sum(len(timings[s]) for s in STEPS if s != "download")
+    # Workers run side by side; the slowest one bounds the run
+    wall = max(r["wall_s"] for r in results)
+    print(json.dumps({
+        "app": args.app,
+        "sessions": args.sessions,
+        "workers": len(jobs),
+        "iterations": args.iterations,
+        "seed_rows": args.seed_rows,
+        "reruns": reruns,
+        "wall_s": round(wall, 3),
+        "reruns_per_s": round(reruns / wall, 2),
+        "saves_per_s": round(len(timings["save"]) / wall, 2),
+        "latency_ms": {step: _percentiles(v) for step, v in timings.items() if v},
+        "rerun_latency_ms": _percentiles([x for s in STEPS if s != "download" for x in timings[s]]),
+        "peak_rss_mb": [r["peak_rss_mb"] for r in results],
+        "cnb_requests": server.hits,
+        "errors": sum(r["errors"] for r in results),
+    }, indent=1))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""First-paint and rerun time of the Streamlit apps.
+
+Every app runs in a fresh interpreter under streamlit.testing's AppTest,
+with an empty database and feed cache and the CNB URL pointed at a closed
+local port, so nothing but the script itself is measured. Prints one JSON
+object per app: first paint (cold imports + first run), rerun median / p90
+and which heavy optional modules the first paint imported.
+
+    python bench/startup.py                       # apps in this tree
+    python bench/startup.py --ref HEAD~1          # another revision, via git worktree
+    python bench/startup.py --runs 50 CNB_test_app.py
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+APPS = ["CNB_test_app.py", "vytah_test_app.py", "app.py", "ENG_app.py"]
+HEAVY = ["altair", "requests", "pyarrow"]
+
+_CHILD = r"""
+import json, statistics, sys, time
+t0 = time.perf_counter()
+from streamlit.testing.v1 import AppTest
+path, runs, heavy = sys.argv[1], int(sys.argv[2]), sys.argv[3].split(",")
+t1 = time.perf_counter()
+at = AppTest.from_file(path, default_timeout=120).run()
+first = time.perf_counter() - t1
+loaded = [m for m in heavy if m in sys.modules]
+times = []
+for _ in range(runs):
+    t = time.perf_counter()
+    at.run()
+    times.append(time.perf_counter() - t)
+times.sort()
+print(json.dumps({
+    "streamlit_import_s": round(t1 - t0, 4),
+    "first_paint_s": round(first, 4),
+    "rerun_median_s": round(statistics.median(times), 4),
+    "rerun_p90_s": round(times[int(0.9 * (len(times) - 1))], 4),
+    "heavy_loaded": loaded,
+    "errors": [str(e.value) for e in at.exception],
+}))
+"""
+
+
+def measure(root: str, app: str, runs: int) -> dict:
+    with tempfile.TemporaryDirectory() as tmp:
+        env = dict(
+            os.environ,
+            EXPENSES_DB=os.path.join(tmp, "expenses.db"),
+            CNB_CACHE_DIR=os.path.join(tmp, "cnb"),
+            HOLIDAY_CACHE_DIR=os.path.join(tmp, "holidays"),
+            CNB_BASE_URL="http://127.0.0.1:9/",
+        )
+        out = subprocess.run(
+            [sys.executable, "-c", _CHILD, os.path.join(root, app), str(runs), ",".join(HEAVY)],
+            cwd=tmp, env=env, capture_output=True, text=True, check=True,
+        )
+    result = json.loads(out.stdout.strip().splitlines()[-1])
+    return {"app": app, "runs": runs, **result}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("apps", nargs="*", default=APPS)
+    parser.add_argument("--runs", type=int, default=20)
+    parser.add_argument("--ref", help="measure this git revision instead of the working tree")
+    args = parser.parse_args()
+
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    worktree = None
+    if args.ref:
+        worktree = tempfile.mkdtemp(prefix="bench-")
+        subprocess.run(["git", "-C", root, "worktree", "add", "--detach", worktree, args.ref],
+                       check=True, capture_output=True)
+        root = worktree
+    try:
+        for app in args.apps:
+            if os.path.exists(os.path.join(root, app)):
+                print(json.dumps({"ref": args.ref or "worktree", **measure(root, app, args.runs)}))
+    finally:
+        if worktree:
+            subprocess.run(["git", "-C", os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                            "worktree", "remove", "--force", worktree], check=True)
+
+
+if __name__ == "__main__":
+    main()
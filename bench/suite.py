@@ -0,0 +1,292 @@
+"""Offline micro-benchmarks for the expense_core hot paths.
+
+Nothing touches the network: CNB feeds come from the real-format fixtures
+in bench/fixtures/ (a daily `denni_kurz.txt` and a 2024 `rok.txt`, see
+cnb_standin.py), served to FeedCache through an in-process session. Ledgers are synthetic and
+seeded, at 1k / 100k / 1M rows by default. Prints one JSON object per
+case; `--out` also writes the whole run (with versions and git revision)
+as one JSON document, and `--baseline` adds the ratio to an earlier one.
+
+    python bench/suite.py                         # everything, default sizes
+    python bench/suite.py --sizes 1000 100000 -k ledger export
+    python bench/suite.py --out bench.json --baseline bench-v1.json
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import date as dt_date, datetime, timedelta
+from urllib.parse import parse_qs, urlparse
+
+import numpy as np
+import pandas as pd
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from expense_core.aggregates import CategoryStats  # noqa: E402
+from expense_core.catalog import CATEGORIES, COUNTRIES, COUNTRY_TO_CODE  # noqa: E402
+from expense_core.charts import category_bar, spend_line, spend_over_time  # noqa: E402
+from expense_core.export import export_bytes  # noqa: E402
+from expense_core.feed_cache import FeedCache, RateLimiter  # noqa: E402
+from expense_core.ledger import Ledger  # noqa: E402
+from expense_core.rates import RateHistory, parse_rate_from_txt  # noqa: E402
+from expense_core.warmup import PRAGUE, RateWarmer  # noqa: E402
+
+from cnb_standin import DAILY, YEARLY, daily_feed  # noqa: E402
+
+SIZES = (1_000, 100_000, 1_000_000)
+_SCRATCH = tempfile.TemporaryDirectory(prefix="bench-")    # feed caches; removed at exit
+
+
+class _Response:
+    status_code = 200
+    headers = {}
+
+    def __init__(self, text: str):
+        self.content = text.encode("utf-8")
+
+
+class FixtureSession:
+    """requests-like session answering CNB URLs from the fixtures."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def get(self, url, headers=None, timeout=None):
+        self.calls += 1
+        query = parse_qs(urlparse(url).query)
+        if "rok" in query:
+            return _Response(YEARLY)
+        day = query.get("date", [DAILY[:10]])[0]
+        return _Response(daily_feed(datetime.strptime(day, "%d.%m.%Y").date()))
+
+
+def synthetic_frame(rows: int, seed: int = 7) -> pd.DataFrame:
+    """Seeded purchases over 2024-2025 in the ledger's column layout."""
+    rng = np.random.default_rng(seed)
+    countries = np.array(COUNTRIES["sk"], dtype=object)
+    country = countries[rng.integers(0, len(countries), rows)]
+    days = np.datetime64("2024-01-01") + rng.integers(0, 731, rows).astype("timedelta64[D]")
+    amount = np.round(rng.gamma(2.0, 250.0, rows), 2)
+    rate = np.round(rng.uniform(0.5, 30.0, rows), 3)
+    return pd.DataFrame({
+        "Date": days,
+        "Country": country,
+        "Currency": [COUNTRY_TO_CODE[c] for c in country],
+        "Amount": amount,
+        "Category": np.array(CATEGORIES["sk"], dtype=object)[rng.integers(0, len(CATEGORIES["sk"]), rows)],
+        "Shop": np.array(["Billa", "Lidl", "Albert", "dm", "Tesco"], dtype=object)[rng.integers(0, 5, rows)],
+        "Note": None,
+        "Converted_CZK": np.round(amount * rate, 2),
+        "Rate_value": rate,
+        "Rate_date": days,
+    })
+
+
+def _measure(fn, runs: int, budget: float, setup=None) -> list:
+    """Wall times of up to `runs` calls, stopping early once `budget` seconds are spent."""
+    times = []
+    spent = 0.0
+    while len(times) < runs and (not times or spent < budget):
+        args = (setup(),) if setup else ()
+        t = time.perf_counter()
+        fn(*args)
+        times.append(time.perf_counter() - t)
+        spent += times[-1]
+    return times
+
+
+# ---------------------------
+# Cases: (name, sized, build(rows) -> (fn, setup, ops))
+# ---------------------------
+def case_parse_rate(_rows):
+    codes = ("EUR", "USD", "GBP", "JPY")
+    return (lambda: [parse_rate_from_txt(DAILY, c) for c in codes for _ in range(250)]), None, 1000
+
+
+def case_parse_yearly(_rows):
+    return (lambda: RateHistory().add_yearly(YEARLY)), None, 1
+
+
+_DAYS = [dt_date(2024, 3, 1) + timedelta(days=i) for i in range(100)]
+_NOW = datetime(2024, 12, 31, 15, 0, tzinfo=PRAGUE)     # after the last 2024 fixing
+
+
+def _feeds(directory: str) -> FeedCache:
+    return FeedCache(directory, session=FixtureSession(), limiter=RateLimiter(0),
+                     today=lambda: dt_date(2025, 1, 1))
+
+
+def _warmer(feeds: FeedCache) -> RateWarmer:
+    # The apps' lookup (RateWarmer.rate_for) on a scheduler that is never started
+    return RateWarmer(feeds, RateHistory(), since=2024, clock=lambda: _NOW)
+
+
+def _lookups(warmer: RateWarmer):
+    return [warmer.rate_for("EUR", d) for d in _DAYS]
+
+
+def case_rate_cold(_rows):
+    # Empty disk cache and history, not warmed up: every day is "fetched" and written to disk
+    def setup():
+        return _warmer(_feeds(tempfile.mkdtemp(dir=_SCRATCH.name)))
+    return _lookups, setup, len(_DAYS)
+
+
+def case_rate_disk(_rows):
+    # Feeds already on disk (final days, no revalidation), fresh history
+    feeds = _feeds(tempfile.mkdtemp(dir=_SCRATCH.name))
+    for d in _DAYS:
+        feeds.daily(d)
+    return _lookups, lambda: _warmer(feeds), len(_DAYS)
+
+
+def case_rate_warm(_rows):
+    # History loaded by the warm-up: a bisect per lookup, no feed access
+    warmer = _warmer(_feeds(tempfile.mkdtemp(dir=_SCRATCH.name)))
+    warmer.load()
+    assert all(warmer.covers(d) for d in _DAYS)
+    return (lambda: _lookups(warmer)), None, len(_DAYS)
+
+
+def case_ledger_append(rows):
+    records = synthetic_frame(rows).to_dict("records")
+    def run(ledger):
+        for r in records:
+            ledger.append(r)
+    return run, Ledger, rows
+
+
+def case_ledger_extend(rows):
+    frame = synthetic_frame(rows)
+    return (lambda ledger: ledger.extend(frame)), Ledger, rows
+
+
+def _ledger(rows) -> Ledger:
+    ledger = Ledger()
+    ledger.extend(synthetic_frame(rows))
+    return ledger
+
+
+def case_ledger_to_frame(rows):
+    ledger = _ledger(rows)
+    def run():
+        ledger._frame_version = -1      # force a rebuild of the cached view
+        ledger.to_frame()
+    return run, None, rows
+
+
+def case_groupby(rows):
+    frame = _ledger(rows).to_frame()
+    return (lambda: frame.groupby("Category", observed=True)["Converted_CZK"].agg(["sum", "count"])), None, rows
+
+
+def case_category_stats(rows):
+    frame = _ledger(rows).to_frame()
+    return (lambda stats: stats.add_frame(frame)), CategoryStats, rows
+
+
+def case_charts(rows):
+    frame = _ledger(rows).to_frame()
+    stats = CategoryStats()
+    stats.add_frame(frame)
+    grouped = stats.to_frame()
+    def run():
+        category_bar(grouped, "Category", "Kategória").to_dict()
+        spend_line(spend_over_time(frame, "W"), "W").to_dict()
+    return run, None, rows
+
+
+def case_export_csv(rows):
+    frame = _ledger(rows).to_frame()
+    return (lambda: export_bytes(frame, "csv")), None, rows
+
+
+CASES = [
+    ("rates.parse_rate_from_txt", False, case_parse_rate),
+    ("rates.add_yearly", False, case_parse_yearly),
+    ("get_rate_for.cold", False, case_rate_cold),
+    ("get_rate_for.disk", False, case_rate_disk),
+    ("get_rate_for.warm", False, case_rate_warm),
+    ("ledger.append", True, case_ledger_append),
+    ("ledger.extend", True, case_ledger_extend),
+    ("ledger.to_frame", True, case_ledger_to_frame),
+    ("summary.groupby", True, case_groupby),
+    ("summary.category_stats", True, case_category_stats),
+    ("charts.build", True, case_charts),
+    ("export.csv", True, case_export_csv),
+]
+
+
+def run_case(name: str, rows, build, runs: int, budget: float) -> dict:
+    fn, setup, ops = build(rows)
+    times = sorted(_measure(fn, runs, budget, setup))
+    median = statistics.median(times)
+    return {
+        "bench": name,
+        "rows": rows,
+        "runs": len(times),
+        "median_s": round(median, 6),
+        "min_s": round(times[0], 6),
+        "p90_s": round(times[int(0.9 * (len(times) - 1))], 6),
+        "per_op_us": round(median / ops * 1e6, 3),
+    }
+
+
+def _meta() -> dict:
+    try:
+        rev = subprocess.run(["git", "-C", ROOT, "rev-parse", "--short", "HEAD"],
+                             capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        rev = None
+    import streamlit
+    return {
+        "git": rev,
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "pandas": pd.__version__,
+        "streamlit": streamlit.__version__,
+        "machine": platform.machine(),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(SIZES))
+    parser.add_argument("-k", dest="match", nargs="+", help="run only cases whose name contains one of these")
+    parser.add_argument("--runs", type=int, default=7)
+    parser.add_argument("--budget", type=float, default=10.0, help="seconds per case before it stops repeating")
+    parser.add_argument("--out", help="write the whole run to this JSON file")
+    parser.add_argument("--baseline", help="earlier --out file to compare medians against")
+    args = parser.parse_args()
+
+    baseline = {}
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = {(r["bench"], r["rows"]): r["median_s"] for r in json.load(f)["results"]}
+
+    results = []
+    for name, sized, build in CASES:
+        if args.match and not any(m in name for m in args.match):
+            continue
+        for rows in (args.sizes if sized else [None]):
+            result = run_case(name, rows, build, args.runs, args.budget)
+            before = baseline.get((name, rows))
+            if before:
+                result["vs_baseline"] = round(result["median_s"] / before, 3)
+            results.append(result)
+            print(json.dumps(result), flush=True)
+
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump({"meta": _meta(), "results": results}, f, indent=1)
+
+
+if __name__ == "__main__":
+    main()
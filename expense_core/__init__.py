@@ -0,0 +1 @@
+"""Shared building blocks for the expense diary Streamlit apps."""
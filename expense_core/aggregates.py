@@ -0,0 +1,76 @@
+"""Running per-category totals of the converted amounts.
+
+Updated in O(1) per saved purchase, so the nudge thresholds and the
+summary metric / chart never need a groupby over the whole ledger.
+Totals are kept in integer haléře, so they do not drift however many
+purchases are added.
+"""
+import numpy as np
+import pandas as pd
+
+from expense_core import money
+
+
+class CategoryStats:
+    """Sum, count, min and max of Converted_CZK per category."""
+
+    def __init__(self):
+        self._stats = {}   # category -> [sum, count, min, max] in haléře
+        self._total = 0
+        self.count = 0
+
+    @property
+    def total(self) -> float:
+        return self._total / money.CZK_SCALE
+
+    def add(self, category: str, value: float):
+        value = int(money.to_minor(value)[0])
+        s = self._stats.get(category)
+        if s is None:
+            self._stats[category] = [value, 1, value, value]
+        else:
+            s[0] += value
+            s[1] += 1
+            if value < s[2]:
+                s[2] = value
+            if value > s[3]:
+                s[3] = value
+        self._total += value
+        self.count += 1
+
+    def merge(self, category: str, total: int, count: int, low: int, high: int):
+        """Fold in an already aggregated group, money in haléře (bulk import, SQL seed)."""
+        total, count, low, high = int(total), int(count), int(low), int(high)
+        s = self._stats.get(category)
+        if s is None:
+            self._stats[category] = [total, count, low, high]
+        else:
+            s[0] += total
+            s[1] += count
+            s[2] = min(s[2], low)
+            s[3] = max(s[3], high)
+        self._total += total
+        self.count += count
+
+    def add_frame(self, frame: pd.DataFrame):
+        """Aggregate only the new rows, then merge the groups."""
+        if frame.empty:
+            return
+        haler = pd.Series(money.to_minor(frame["Converted_CZK"].to_numpy(dtype=float)), index=frame.index)
+        grouped = haler.groupby(frame["Category"], observed=True).agg(["sum", "count", "min", "max"])
+        for category, row in grouped.iterrows():
+            self.merge(category, row["sum"], row["count"], row["min"], row["max"])
+
+    def sum(self, category: str) -> float:
+        s = self._stats.get(category)
+        return s[0] / money.CZK_SCALE if s else 0.0
+
+    def to_frame(self) -> pd.DataFrame:
+        rows = list(self._stats.items())
+        frame = pd.DataFrame(
+            [(c, s[0], s[1], s[2], s[3]) for c, s in rows],
+            columns=["Category", "Converted_CZK", "Count", "Min", "Max"],
+        )
+        for c in ("Converted_CZK", "Min", "Max"):
+            frame[c] = money.from_minor(frame[c].to_numpy(dtype=np.int64))
+        return frame
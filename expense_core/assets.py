@@ -0,0 +1,110 @@
+"""Elevator screen images, resized and re-encoded once per process.
+
+The source PNGs are 1024x1536 and about 2 MB each. The centered layout
+shows them at most ~700 px wide, so every screen gets variants at the
+widths it can be drawn at, a few tens of KB each instead of the original.
+
+`picture()` writes every width as WebP and JPEG into the app's static/
+folder under content-hashed names and returns an <img srcset> that points
+at app/static/ (server.enableStaticServing), so the browser picks the
+width it needs and reruns send no image bytes.
+"""
+import hashlib
+import html
+import io
+import os
+import tempfile
+from functools import lru_cache
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+ASSET_DIR = os.path.join(ROOT, "images_vytah_appka")
+
+WIDTHS = (480, 720, 960)    # column width at 1x / 1.5x / 2x pixel density
+DEFAULT_WIDTH = 720
+FORMATS = {"webp": ("WEBP", "webp"), "jpeg": ("JPEG", "jpg")}
+QUALITY = 80
+STATIC_DIR = "static"       # served at app/static/, next to the main script
+SIZES = "(max-width: 736px) 100vw, 704px"   # centered layout column
+
+
+def source_path(name: str) -> str:
+    """Path of an original image; looked up in images_vytah_appka/ first, then the repo root."""
+    for directory in (ASSET_DIR, ROOT):
+        path = os.path.join(directory, name)
+        if os.path.exists(path):
+            return path
+    raise FileNotFoundError(name)
+
+
+def fit_width(width: int) -> int:
+    """Smallest prepared width that covers `width` pixels."""
+    return next((w for w in WIDTHS if w >= width), WIDTHS[-1])
+
+
+@lru_cache(maxsize=64)
+def _encode(path: str, mtime_ns: int, width: int, fmt: str, quality: int) -> bytes:
+    from PIL import Image
+
+    with Image.open(path) as img:
+        img = img.convert("RGB")
+        if img.width > width:
+            img = img.resize((width, round(img.height * width / img.width)), Image.LANCZOS)
+        out = io.BytesIO()
+        img.save(out, FORMATS[fmt][0], quality=quality, optimize=True)
+    return out.getvalue()
+
+
+def _write_bytes(path: str, data: bytes):
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+    with os.fdopen(fd, "wb") as f:
+        f.write(data)
+    os.chmod(tmp, 0o644)
+    os.replace(tmp, path)
+
+
+@lru_cache(maxsize=64)
+def _publish(path: str, mtime_ns: int, width: int, fmt: str, directory: str) -> str:
+    data = _encode(path, mtime_ns, width, fmt, QUALITY)
+    stem = os.path.splitext(os.path.basename(path))[0].replace(" ", "_")
+    name = f"{stem}-{width}-{hashlib.sha256(data).hexdigest()[:12]}.{FORMATS[fmt][1]}"
+    target = os.path.join(directory, name)
+    # Content-addressed: an existing file with this name already holds these bytes
+    if not os.path.exists(target):
+        os.makedirs(directory, exist_ok=True)
+        _write_bytes(target, data)
+        # Streamlit sends Last-Modified but no Cache-Control for app/static/, so
+        # browsers cache heuristically from the file's age; the source's mtime
+        # is the honest one, and the hashed name makes any staleness impossible
+        os.utime(target, ns=(mtime_ns, mtime_ns))
+    return f"app/static/{name}"
+
+
+def static_url(name: str, width: int = DEFAULT_WIDTH, fmt: str = "webp", root: str = ROOT) -> str:
+    """URL of a variant copied into `root`/static/ under a content-hashed name."""
+    path = source_path(name)
+    return _publish(path, os.stat(path).st_mtime_ns, fit_width(width), fmt, os.path.join(root, STATIC_DIR))
+
+
+@lru_cache(maxsize=64)
+def _source_width(path: str, mtime_ns: int) -> int:
+    from PIL import Image
+
+    with Image.open(path) as img:
+        return img.width
+
+
+def picture(name: str, alt: str = "", root: str = ROOT) -> str:
+    """<picture> markup for st.markdown: WebP srcset with a JPEG fallback, served from app/static/."""
+    path = source_path(name)
+    full = _source_width(path, os.stat(path).st_mtime_ns)
+    # Images are never upscaled, so narrow sources offer fewer widths
+    widths = sorted({min(w, full) for w in WIDTHS})
+
+    def srcset(fmt):
+        return ", ".join(f"{static_url(name, w, fmt, root)} {w}w" for w in widths)
+
+    return (
+        f'<picture><source type="image/webp" srcset="{srcset("webp")}" sizes="{SIZES}">'
+        f'<img src="{static_url(name, DEFAULT_WIDTH, "jpeg", root)}" srcset="{srcset("jpeg")}" '
+        f'sizes="{SIZES}" alt="{html.escape(alt)}" style="width: 100%; height: auto"></picture>'
+    )
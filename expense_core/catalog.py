@@ -0,0 +1,423 @@
+"""Static UI tables shared by the apps.
+
+Texts, categories, countries and the IssueCoin message packs are built once
+per process on first import instead of being re-declared (and
+COUNTRY_TO_CODE re-derived by string splitting) on every Streamlit rerun.
+"""
+
+# ---------------------------
+# Translations (CNB_test_app.py; the elevator app overrides a few keys)
+# ---------------------------
+TEXTS = {
+    "sk": {
+        "app_title": "💰 Výdavkový denník / Výdajový deník",
+        "subtitle": "CZK = vždy 1:1. Ostatné meny podľa denného kurzu ČNB. "
+                    "Ak pre vybraný deň nie je kurz, použije sa posledný dostupný kurz. / "
+                    "CZK = vždy 1:1. Ostatní měny podle denního kurzu České národní banky. "
+                    "Pokud kurz není k dispozici, použije se poslední známý kurz.",
+        "date": "📅 Dátum nákupu / Datum nákupu",
+        "country": "🌍 Krajina + mena / Měna",
+        "amount": "💵 Suma / Částka",
+        "category": "📂 Kategória / Kategorie",
+        "shop": "🏬 Obchod / miesto / Obchod / místo",
+        "note": "📝 Poznámka",
+        "save": "💾 Uložiť nákup / Uložit nákup",
+        "list": "🧾 Zoznam nákupov / Seznam nákupů",
+        "summary": "📊 Súhrn mesačných výdavkov / Souhrn měsíčních výdajů",
+        "total": "Celkové výdavky / Celkové výdaje",
+        "filter": "🔎 Filter výdavkov / Filtrování výdajů",
+        "yr": "Rok",
+        "mo": "Mesiac / Měsíc",
+        "page_size": "Riadkov na stranu / Řádků na stránku",
+        "sort_by": "Zoradiť podľa / Seřadit podle",
+        "descending": "Zostupne / Sestupně",
+        "search": "🔍 Hľadať / Hledat",
+        "page": "Strana / Stránka",
+        "jump": "📅 Prejsť na dátum / Přejít na datum",
+        "rows": "záznamov / záznamů",
+        "trend": "📈 Výdavky v čase / Výdaje v čase",
+        "daily": "Denne / Denně",
+        "weekly": "Týždenne / Týdně",
+        "gzip": "Komprimovať (gzip) / Komprimovat (gzip)",
+        "format": "Formát",
+        "rates_as_of": "Kurzy ČNB k / k {day}",
+        "rates_loading": "Načítavam kurzy ČNB… / Načítám kurzy ČNB…",
+        "all": "Všetko / Vše",
+        "currency": "💱 Mena / Měna",
+        "rate_err": "❌ Kurz sa nepodarilo načítať. / Kurz se nepodařilo načíst.",
+        "saved_ok": "Záznam uložený! / Záznam uložen!",
+        "rate_info": "Použitý kurz / Použitý kurz",
+        "rate_from": "k / k",
+        "import": "📥 Import z CSV",
+        "import_btn": "📥 Importovať / Importovat",
+        "import_ok": "Importovaných záznamov / Importovaných záznamů: {n}",
+        "import_skipped": "Bez kurzu alebo chybné riadky / Bez kurzu nebo chybné řádky: {n}",
+        "export": "💾 Exportovať / Exportovat"
+    },
+    "en": {
+        "app_title": "💰 Expense Diary",
+        "subtitle": "CZK = always 1:1. Other currencies follow CNB daily rates. "
+                    "If no rate is available for the selected date, the last available rate is used.",
+        "date": "📅 Purchase date",
+        "country": "🌍 Country + currency",
+        "amount": "💵 Amount",
+        "category": "📂 Category",
+        "shop": "🏬 Shop / place",
+        "note": "📝 Note",
+        "save": "💾 Save purchase",
+        "list": "🧾 Purchase list",
+        "summary": "📊 Monthly expenses summary",
+        "total": "Total expenses",
+        "filter": "🔎 Expense filter",
+        "yr": "Year",
+        "mo": "Month",
+        "page_size": "Rows per page",
+        "sort_by": "Sort by",
+        "descending": "Descending",
+        "search": "🔍 Search",
+        "page": "Page",
+        "jump": "📅 Jump to date",
+        "rows": "rows",
+        "trend": "📈 Spending over time",
+        "daily": "Daily",
+        "weekly": "Weekly",
+        "gzip": "Compress (gzip)",
+        "format": "Format",
+        "rates_as_of": "CNB rates as of {day}",
+        "rates_loading": "Loading CNB rates…",
+        "all": "All",
+        "currency": "💱 Currency",
+        "rate_err": "❌ Could not fetch exchange rate.",
+        "saved_ok": "Saved!",
+        "rate_info": "Applied rate",
+        "rate_from": "as of",
+        "import": "📥 Import from CSV",
+        "import_btn": "📥 Import",
+        "import_ok": "Imported rows: {n}",
+        "import_skipped": "Rows without a rate or invalid: {n}",
+        "export": "💾 Export"
+    }
+}
+
+_ELEVATOR_OVERRIDES = {
+    "sk": {
+        "subtitle": (
+            "CZK = vždy 1:1. Ostatné meny podľa denného kurzu ČNB (TXT feed). "
+            "Ak pre vybraný deň nie je kurz, použije sa posledný dostupný kurz. "
+            "Sviatky CZ / SK sú vstavané, ostatné krajiny cez Calendarific (API kľúč z prostredia)."
+        ),
+        "shop": "🏬 Obchod / miesto",
+        "rate_err": "❌ Kurz sa nepodarilo načítať (CNB TXT).",
+        "saved_ok": "Záznam uložený!",
+        "rate_info": "Použitý kurz",
+        "rate_from": "k",
+        "holiday_msg": "🎌 Dnes je štátny sviatok ({name}) – uži deň s rozumom!",
+        "issuecoin_title": "🤖 IssueCoin hovorí"
+    },
+    "en": {
+        "subtitle": (
+            "CZK = always 1:1. Other currencies follow CNB daily TXT feed. "
+            "If no rate is available for the selected date, the last available rate is used. "
+            "CZ / SK holidays are built in, other countries via Calendarific (API key from environment)."
+        ),
+        "rate_err": "❌ Could not fetch exchange rate (CNB TXT).",
+        "holiday_msg": "🎌 Today is a public holiday ({name}) – enjoy wisely!",
+        "issuecoin_title": "🤖 IssueCoin says"
+    }
+}
+
+ELEVATOR_TEXTS = {lang: {**TEXTS[lang], **_ELEVATOR_OVERRIDES[lang]} for lang in TEXTS}
+
+CATEGORIES = {
+    "sk": [
+        "Potraviny 🛒 / Potraviny 🛒",
+        "Drogérie 🧴 / Drogérie 🧴",
+        "Doprava 🚌 / Doprava 🚌",
+        "Reštaurácie a bary 🍽️ / Restaurace a bary 🍽️",
+        "Zábava 🎉 / Zábava 🎉",
+        "Odevy 👕 / Oblečení 👕",
+        "Obuv 👟 / Obuv 👟",
+        "Elektronika 💻 / Elektronika 💻",
+        "Domácnosť / nábytok 🛋️ / Domácnost / nábytek 🛋️",
+        "Šport a voľný čas 🏀 / Sport a volný čas 🏀",
+        "Zdravie a lekáreň 💊 / Zdraví a lékárna 💊",
+        "Cestovanie / dovolenka ✈️ / Cestování / dovolená ✈️",
+        "Vzdelávanie / kurzy 📚 / Vzdělávání / kurzy 📚"
+    ],
+    "en": [
+        "Groceries 🛒",
+        "Drugstore 🧴",
+        "Transport 🚌",
+        "Restaurants & Bars 🍽️",
+        "Entertainment 🎉",
+        "Clothing 👕",
+        "Shoes 👟",
+        "Electronics 💻",
+        "Household / Furniture 🛋️",
+        "Sports & Leisure 🏀",
+        "Health & Pharmacy 💊",
+        "Travel / Holiday ✈️",
+        "Education / Courses 📚"
+    ]
+}
+
+MESSAGES = {
+    "sk": {
+        "food": "🍎 Potraviny niečo stoja – pri väčšej rodine je to prirodzené. 😉 / "
+                "Potraviny něco stojí – u větší rodiny je to přirozené. 😉",
+        "fun": "🎉 Zábavy nikdy nie je dosť! Len pozor, aby ti ešte zostalo aj na chlebík. 😉 / "
+               "Zábavy nikdy není dost! Jen pozor, ať ti ještě zbyde i na chleba. 😉",
+        "drug": "🧴 Drogéria je drahá, hlavne keď sú v tom deti. 😉 / "
+                "Drogérie je drahá, hlavně když jsou v tom děti. 😉",
+        "elec": "💻 Nový kúsok? Nech dlho slúži a uľahčí deň. 🚀 / "
+                "Nový kousek? Ať dlouho vydrží a usnadní den. 🚀",
+    },
+    "en": {
+        "food": "🍎 Groceries are pricey – with a bigger family, that’s normal. 😉",
+        "fun": "🎉 There’s never too much fun! Just keep a little left for bread. 😉",
+        "drug": "🧴 Drugstore items can be expensive, especially with kids. You’ve got this. 😉",
+        "elec": "💻 New gadget? May it last and make life easier. 🚀",
+    }
+}
+
+# ---------------------------
+# Countries + currencies
+# ---------------------------
+COUNTRIES = {
+    "sk": [
+        "Česko – CZK Kč",
+        "Slovensko – EUR €",
+        "Nemecko – EUR € / Německo – EUR €",
+        "Rakúsko – EUR € / Rakousko – EUR €",
+        "Francúzsko – EUR € / Francie – EUR €",
+        "Španielsko – EUR € / Španělsko – EUR €",
+        "Taliansko – EUR € / Itálie – EUR €",
+        "Holandsko – EUR € / Nizozemsko – EUR €",
+        "Belgicko – EUR € / Belgie – EUR €",
+        "Fínsko – EUR € / Finsko – EUR €",
+        "Írsko – EUR € / Irsko – EUR €",
+        "Portugalsko – EUR €",
+        "Grécko – EUR € / Řecko – EUR €",
+        "Slovinsko – EUR €",
+        "Litva – EUR €",
+        "Lotyšsko – EUR €",
+        "Estónsko – EUR €",
+        "Malta – EUR €",
+        "Cyprus – EUR €",
+        "Chorvátsko – EUR € / Chorvatsko – EUR €",
+        "USA – USD $",
+        "Veľká Británia – GBP £ / Velká Británie – GBP £",
+        "Poľsko – PLN zł / Polsko – PLN zł",
+        "Maďarsko – HUF Ft / Maďarsko – HUF Ft",
+        "Švajčiarsko – CHF ₣ / Švýcarsko – CHF ₣",
+        "Dánsko – DKK kr / Dánsko – DKK kr",
+        "Švédsko – SEK kr / Švédsko – SEK kr",
+        "Nórsko – NOK kr / Norsko – NOK kr",
+        "Kanada – CAD $",
+        "Japonsko – JPY ¥"
+    ],
+    "en": [
+        "Czechia – CZK Kč",
+        "Slovakia – EUR €",
+        "Germany – EUR €",
+        "Austria – EUR €",
+        "France – EUR €",
+        "Spain – EUR €",
+        "Italy – EUR €",
+        "Netherlands – EUR €",
+        "Belgium – EUR €",
+        "Finland – EUR €",
+        "Ireland – EUR €",
+        "Portugal – EUR €",
+        "Greece – EUR €",
+        "Slovenia – EUR €",
+        "Lithuania – EUR €",
+        "Latvia – EUR €",
+        "Estonia – EUR €",
+        "Malta – EUR €",
+        "Cyprus – EUR €",
+        "Croatia – EUR €",
+        "USA – USD $",
+        "United Kingdom – GBP £",
+        "Poland – PLN zł",
+        "Hungary – HUF Ft",
+        "Switzerland – CHF ₣",
+        "Denmark – DKK kr",
+        "Sweden – SEK kr",
+        "Norway – NOK kr",
+        "Canada – CAD $",
+        "Japan – JPY ¥"
+    ]
+}
+
+COUNTRY_TO_CODE = {}
+for label in COUNTRIES["sk"] + COUNTRIES["en"]:
+    code = label.split("–")[-1].strip().split()[0]
+    COUNTRY_TO_CODE[label] = code
+
+# ISO 3166 codes in COUNTRIES order (both language lists share it)
+COUNTRY_ISO = [
+    "CZ", "SK", "DE", "AT", "FR", "ES", "IT", "NL", "BE", "FI", "IE", "PT", "GR", "SI", "LT",
+    "LV", "EE", "MT", "CY", "HR", "US", "GB", "PL", "HU", "CH", "DK", "SE", "NO", "CA", "JP",
+]
+COUNTRY_TO_ISO = {}
+for labels in COUNTRIES.values():
+    COUNTRY_TO_ISO.update(zip(labels, COUNTRY_ISO))
+
+# ---------------------------
+# IssueCoin – seasonal & fun messages (RAG-like static logic)
+# ---------------------------
+SEASONAL_PACK = {
+    "spring": {
+        "emoji": "🌷🧘‍♀️🌱💐🥚",
+        "lines_sk": [
+            "Jar je tu! 💐 Dýchni zhlboka a míňaj s rozumom.",
+            "Cvičíme a šetríme – dvojitý zisk! 🧘‍♀️",
+            "Záhradka rastie, rozpočet nech neklesá. 🌱"
+        ],
+        "lines_en": [
+            "Spring vibes! 💐 Spend smart, breathe easy.",
+            "Move your body, not your budget. 🧘‍♀️",
+            "Let the garden grow, not the expenses. 🌱"
+        ]
+    },
+    "summer": {
+        "emoji": "☀️😎🏖️🍉",
+        "lines_sk": [
+            "Leto volá! ☀️ Slnečné okuliare a rozumné nákupy.",
+            "More, dovolenka, prázdniny – a malý limit. 😎",
+            "Melón áno, mínus nie. 🍉"
+        ],
+        "lines_en": [
+            "Summer time! ☀️ Shades on, costs down.",
+            "Beach, holidays, sunshine – keep it balanced. 😎",
+            "Yes to watermelon, no to overspend. 🍉"
+        ]
+    },
+    "autumn": {
+        "emoji": "🍂🍄🧺🫐",
+        "lines_sk": [
+            "Jeseň prichádza 🍂 – košík húb áno, dlh nie.",
+            "Borievky či čučoriedky? Nech sú sladké, nie účet. 🫐",
+            "Viac dažďa, menej impulzov. ☔"
+        ],
+        "lines_en": [
+            "Autumn mode 🍂 – mushrooms in basket, debt out.",
+            "Blueberries sweet, bills not. 🫐",
+            "More rain, fewer impulses. ☔"
+        ]
+    },
+    "winter": {
+        "emoji": "❄️🧣☃️🎄",
+        "lines_sk": [
+            "Zima klope na dvere ❄️ – šál zahreje, rozpočet šetrí.",
+            "Hrnček teplý, nákupy pokojné. ☕",
+            "Sneh vonku, pohoda doma. ☃️"
+        ],
+        "lines_en": [
+            "Winter is here ❄️ – scarf on, spending calm.",
+            "Warm mug, cool head. ☕",
+            "Snow outside, peace inside. ☃️"
+        ]
+    },
+    "xmas": {
+        "emoji": "🎄✨🎁",
+        "lines_sk": [
+            "Vianočná pohoda 🎄 – od 10.12. do 26.12. spomaľ a uži si blízkych.",
+            "Darček s láskou, nie s nervami. 🎁",
+            "Kľudné sviatky a rozumná peňaženka. ✨"
+        ],
+        "lines_en": [
+            "Christmas calm 🎄 – Dec 10–26, slow down and enjoy.",
+            "Gifts with love, not with stress. 🎁",
+            "Peaceful holidays, mindful wallet. ✨"
+        ]
+    },
+    "easter": {
+        "emoji": "🐣🌼🥚",
+        "lines_sk": [
+            "Veľká noc prichádza 🐣 – chvíľa pokoja a pohody.",
+            "Vajíčko áno, prázdny účet nie. 🥚",
+            "Jar + sviatky = oddych a mierne nákupy. 🌼"
+        ],
+        "lines_en": [
+            "Easter time 🐣 – peace and balance.",
+            "Eggs yes, empty wallet no. 🥚",
+            "Spring + holiday = rest and mindful spending. 🌼"
+        ]
+    }
+}
+
+GENERAL_QUOTES = {
+    "sk": [
+        "💡 Ušetri dnes, potešíš sa zajtra.",
+        "💸 Aj drobné sa rátajú – špeciálne v piatok. 😉",
+        "🛒 Tvoj košík je plný, verím, že aj s rozumom!",
+        "😅 Ceny rastú, ale tvoj prehľad tiež."
+    ],
+    "en": [
+        "💡 Save today, smile tomorrow.",
+        "💸 Every coin counts – especially on Fridays. 😉",
+        "🛒 Full cart, calm mind!",
+        "😅 Prices rise, but so does your awareness."
+    ]
+}
+
+# ---------------------------
+# Legacy diary (app.py)
+# ---------------------------
+LEGACY_TEXTS_SK = {
+    "title": "💸 Môj mesačný výdavkový denník („Výdejový deník“)",
+    "intro": "Zaznamenaj si svoje nákupy a výdavky – nech máš prehľad, aj keď si na dovolenke ☀️ / "
+             "Zaznamenej si své nákupy a výdaje – ať máš přehled, i když jsi na dovolené ☀️",
+    "add": "➕ Pridať nákup / Přidat nákup",
+    "date": "📅 Dátum nákupu / Datum nákupu",
+    "shop": "🏪 Obchod / miesto (Obchod / místo)",
+    "country": "🌍 Krajina / Krajina",
+    "currency": "💱 Mena / Měna",
+    "amount": "💰 Suma / Suma",
+    "category": "📂 Kategória / Kategorie",
+    "note": "📝 Poznámka (napr. kúpený aj šampón, pivo v bare...) / "
+            "Poznámka (např. koupený i šampon, pivo v baru...)",
+    "save": "💾 Uložiť nákup / Uložit nákup",
+    "added": "✅ Nákup bol pridaný! / Nákup byl přidán!",
+    "list": "📊 Zoznam nákupov / Seznam nákupů",
+    "summary": "📈 Súhrn mesačných výdavkov / Souhrn měsíčních výdajů",
+    "total": "💰 Celkové výdavky / Celkové výdaje",
+    "tip_high": "💡 Pozor! Na zábavu míňaš viac ako 30 %. "
+                "Skús odložiť časť bokom na nečakané výdavky. 😉 / "
+                "💡 Pozor! Na zábavu utrácíš více než 30 %. "
+                "Zkus odložit část stranou na nečekané výdaje. 😉",
+    "tip_info": "Najviac si minul(a) na _{cat}_ ({pct:.1f}% z celkových výdavkov).",
+    "empty": "Zatiaľ nemáš žiadne nákupy. Pridaj aspoň jeden a uvidíš svoje dáta ✨ / "
+             "Zatím nemáš žádné nákupy. Přidej alespoň jeden a uvidíš svá data ✨",
+    "countries": ["Slovensko / Slovensko", "Česko / Česko", "Chorvátsko / Chorvatsko", "Iné / Jiné"],
+    "currencies": ["CZK (Kč)", "EUR (€)", "USD ($)", "GBP (£)"],
+    "categories": ["Potraviny / Potraviny", "Drogérie / Drogérie", "Doprava / Doprava",
+                   "Reštaurácie a bary / Restaurace a bary", "Zábava / Zábava"]
+}
+
+LEGACY_TEXTS_EN = {
+    "title": "💸 My Monthly Expense Diary",
+    "intro": "Record your purchases and expenses – keep track, even on vacation ☀️",
+    "add": "➕ Add Purchase",
+    "date": "📅 Date",
+    "shop": "🏪 Shop",
+    "country": "🌍 Country",
+    "currency": "💱 Currency",
+    "amount": "💰 Amount",
+    "category": "📂 Category",
+    "note": "📝 Note (e.g. shampoo, beer in bar...)",
+    "save": "💾 Save purchase",
+    "added": "✅ Purchase has been added!",
+    "list": "📊 List of Purchases",
+    "summary": "📈 Monthly Expense Summary",
+    "total": "💰 Total Expenses",
+    "tip_high": "💡 Watch out! You’re spending more than 30% on entertainment. "
+                "Try saving a portion for unexpected expenses. 😉",
+    "tip_info": "Most of your spending went to _{cat}_ ({pct:.1f}% of total expenses).",
+    "empty": "No purchases yet. Add at least one to see your data ✨",
+    "countries": ["Slovakia", "Czechia", "Croatia", "Other"],
+    "currencies": ["CZK (Czech koruna)", "EUR (Euro)", "USD (US Dollar)", "GBP (British Pound)"],
+    "categories": ["Food", "Drugstore", "Transport", "Restaurants & Bars", "Entertainment"]
+}
@@ -0,0 +1,51 @@
+"""Summary charts.
+
+Data is aggregated on the server before it reaches Vega-Lite, so a chart
+spec carries one point per bar / day / week instead of the raw ledger.
+altair is imported only when a chart is actually built.
+"""
+import pandas as pd
+
+FREQUENCIES = ("D", "W")
+
+
+def category_bar(grouped: pd.DataFrame, group_col: str, title: str):
+    import altair as alt
+    return (
+        alt.Chart(grouped)
+        .mark_bar()
+        .encode(
+            x=alt.X(group_col, sort="-y", title=title),
+            y=alt.Y("Converted_CZK", title="CZK"),
+            tooltip=[group_col, "Converted_CZK", "Count"]
+        )
+        .properties(width=600, height=300)
+    )
+
+
+def spend_over_time(frame: pd.DataFrame, freq: str = "D", year=None, month=None, category=None) -> pd.DataFrame:
+    """Date | Converted_CZK summed per day ("D") or week starting Monday ("W")."""
+    dates = pd.to_datetime(frame["Date"])
+    mask = pd.Series(True, index=frame.index)
+    if year is not None:
+        mask &= dates.dt.year == year
+    if month is not None:
+        mask &= dates.dt.month == month
+    if category is not None:
+        mask &= frame["Category"] == category
+    periods = dates[mask].dt.to_period(freq).dt.start_time.rename("Date")
+    return frame.loc[mask, "Converted_CZK"].groupby(periods).sum().round(2).reset_index()
+
+
+def spend_line(series: pd.DataFrame, freq: str):
+    import altair as alt
+    return (
+        alt.Chart(series)
+        .mark_line(point=True)
+        .encode(
+            x=alt.X("Date:T", title=None),
+            y=alt.Y("Converted_CZK:Q", title="CZK"),
+            tooltip=[alt.Tooltip("Date:T"), alt.Tooltip("Converted_CZK:Q")]
+        )
+        .properties(width=600, height=250)
+    )
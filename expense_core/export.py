@@ -0,0 +1,127 @@
+"""Ledger export and typed (Parquet / Arrow IPC) re-import.
+
+The file is produced only when the download button is clicked (Streamlit
+calls a deferred `data` callable) and CSV is encoded chunk by chunk, so
+there is never a full CSV string next to its encoded bytes. Optional gzip
+compresses the same chunk stream.
+
+Parquet and Arrow IPC keep column types (date32 dates, float64 amounts,
+dictionary-encoded Country / Currency / Category) and reload without
+parsing. pyarrow is optional and imported only when one of them is used.
+"""
+import gzip
+import importlib.util
+import io
+
+import pandas as pd
+
+from expense_core.ledger import EXPENSE_COLUMNS
+
+CHUNK_ROWS = 20_000
+
+HAS_ARROW = importlib.util.find_spec("pyarrow") is not None
+# format -> (label, mime type); the format name doubles as file extension
+FORMATS = {"csv": ("CSV", "text/csv")}
+if HAS_ARROW:
+    FORMATS["parquet"] = ("Parquet", "application/vnd.apache.parquet")
+    FORMATS["arrow"] = ("Arrow IPC", "application/vnd.apache.arrow.file")
+
+DICTIONARY_COLUMNS = ("Country", "Currency", "Category")
+# A row without one of these cannot be stored, summed or rolled up
+REQUIRED_COLUMNS = ("Date", "Currency", "Amount", "Converted_CZK")
+DATE_COLUMNS = ("Date", "Rate_date")
+FLOAT_COLUMNS = ("Amount", "Converted_CZK", "Rate_value")
+
+
+def iter_csv(frame: pd.DataFrame, chunk_rows: int = CHUNK_ROWS):
+    """Yield the CSV as UTF-8 byte chunks (header in the first one)."""
+    if frame.empty:
+        yield frame.to_csv(index=False).encode("utf-8")
+        return
+    for start in range(0, len(frame), chunk_rows):
+        part = frame.iloc[start:start + chunk_rows]
+        yield part.to_csv(index=False, header=start == 0).encode("utf-8")
+
+
+def csv_bytes(frame: pd.DataFrame, compress: bool = False) -> bytes:
+    buf = io.BytesIO()
+    out = gzip.GzipFile(fileobj=buf, mode="wb") if compress else buf
+    for chunk in iter_csv(frame):
+        out.write(chunk)
+    if compress:
+        out.close()
+    return buf.getvalue()
+
+
+def _schema():
+    import pyarrow as pa
+    fields = []
+    for c in EXPENSE_COLUMNS:
+        if c in DATE_COLUMNS:
+            fields.append(pa.field(c, pa.date32()))
+        elif c in FLOAT_COLUMNS:
+            fields.append(pa.field(c, pa.float64()))
+        elif c in DICTIONARY_COLUMNS:
+            fields.append(pa.field(c, pa.dictionary(pa.int32(), pa.string())))
+        else:
+            fields.append(pa.field(c, pa.string()))
+    return pa.schema(fields)
+
+
+def arrow_table(frame: pd.DataFrame):
+    """Ledger frame as a typed pyarrow Table."""
+    import pyarrow as pa
+    typed = frame[EXPENSE_COLUMNS].copy()
+    for c in DATE_COLUMNS:
+        typed[c] = pd.to_datetime(typed[c], errors="coerce").dt.date
+    return pa.Table.from_pandas(typed, schema=_schema(), preserve_index=False)
+
+
+def parquet_bytes(frame: pd.DataFrame) -> bytes:
+    import pyarrow.parquet as pq
+    buf = io.BytesIO()
+    pq.write_table(arrow_table(frame), buf, compression="zstd")
+    return buf.getvalue()
+
+
+def arrow_bytes(frame: pd.DataFrame) -> bytes:
+    import pyarrow as pa
+    table = arrow_table(frame)
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_file(sink, table.schema, options=pa.ipc.IpcWriteOptions(compression="zstd")) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes()
+
+
+def export_bytes(frame: pd.DataFrame, fmt: str = "csv", compress: bool = False) -> bytes:
+    if fmt == "parquet":
+        return parquet_bytes(frame)
+    if fmt == "arrow":
+        return arrow_bytes(frame)
+    return csv_bytes(frame, compress)
+
+
+def read_ledger(data: bytes, fmt: str) -> pd.DataFrame:
+    """Rows of a Parquet / Arrow IPC export, in the ledger's column layout.
+
+    Raises ValueError for an unreadable file or one without every ledger column.
+    """
+    import pyarrow as pa
+    source = pa.BufferReader(data)
+    # ArrowInvalid (a ValueError) for anything that is not such a file
+    if fmt == "parquet":
+        import pyarrow.parquet as pq
+        table = pq.read_table(source)
+    else:
+        table = pa.ipc.open_file(source).read_all()
+    missing = [c for c in EXPENSE_COLUMNS if c not in table.column_names]
+    if missing:
+        raise ValueError(f"Missing columns: {', '.join(missing)}")
+    # Dictionary columns arrive as pandas categoricals, dates as datetime64
+    return table.select(EXPENSE_COLUMNS).to_pandas(date_as_object=False)
+
+
+def drop_incomplete(frame: pd.DataFrame):
+    """(rows with every REQUIRED_COLUMNS value, number of rows dropped)."""
+    ok = frame[list(REQUIRED_COLUMNS)].notna().all(axis=1)
+    return frame[ok].reset_index(drop=True), int((~ok).sum())
@@ -0,0 +1,184 @@
+"""On-disk cache of CNB TXT feeds.
+
+Feeds for past dates (and past years) never change, so they are stored
+permanently and never refetched. Today's / latest feed and the current
+year's bulk file are kept for `ttl` seconds and then revalidated with
+`If-None-Match` / `If-Modified-Since`, so an unchanged feed costs a 304.
+Only bodies that parse as a feed are stored: a 200 error page would
+otherwise be served from disk for good.
+
+Network requests share one keep-alive `requests.Session` (its connection
+pool sized for concurrent prefetching, created on the first network call
+so `requests` is not imported by a run served from disk) and pass through a
+process-wide rate limiter. `base_url` can point at a local HTTP stand-in
+instead of cnb.cz.
+"""
+import json
+import os
+import tempfile
+import threading
+import time
+from datetime import date as dt_date
+
+from expense_core.rates import parse_daily_txt
+
+CNB_BASE_URL = os.getenv(
+    "CNB_BASE_URL",
+    "https://www.cnb.cz/cs/financni-trhy/devizovy-trh/kurzy-devizoveho-trhu/kurzy-devizoveho-trhu/",
+)
+CACHE_DIR = os.getenv("CNB_CACHE_DIR", ".cnb_cache")
+LATEST_TTL = 600
+MAX_RATE = 20          # requests per second to the CNB server
+POOL_SIZE = 8
+
+
+def _write_atomic(path: str, text: str):
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
+        f.write(text)
+    os.replace(tmp, path)
+
+
+def _read(path: str):
+    try:
+        with open(path, encoding="utf-8") as f:
+            return f.read()
+    except OSError:
+        return None
+
+
+def _is_daily(text: str) -> bool:
+    return parse_daily_txt(text)[0] is not None
+
+
+def _is_yearly(text: str) -> bool:
+    return text.lstrip().startswith("Datum|")
+
+
+class RateLimiter:
+    """Spaces request starts at least 1/rate seconds apart, across threads."""
+
+    def __init__(self, rate: float, clock=time.monotonic, sleep=time.sleep):
+        self.interval = 1.0 / rate if rate else 0.0
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._next = 0.0
+
+    def wait(self):
+        with self._lock:
+            now = self._clock()
+            start = max(now, self._next)
+            self._next = start + self.interval
+        if start > now:
+            self._sleep(start - now)
+
+
+def _pooled_session(size: int):
+    import requests
+    from requests.adapters import HTTPAdapter
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=size)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+class FeedCache:
+    def __init__(self, directory: str = CACHE_DIR, base_url: str = CNB_BASE_URL, session=None,
+                 ttl: float = LATEST_TTL, timeout: float = 10, clock=time.time, today=dt_date.today,
+                 limiter=None, pool_size: int = POOL_SIZE):
+        self.directory = directory
+        self.base_url = base_url.rstrip("/") + "/"
+        self._session = session
+        self._session_lock = threading.Lock()
+        self._pool_size = pool_size
+        self.limiter = limiter or RateLimiter(MAX_RATE)
+        self.ttl = ttl
+        self.timeout = timeout
+        self._clock = clock
+        self._today = today
+        for sub in ("daily", "year"):
+            os.makedirs(os.path.join(directory, sub), exist_ok=True)
+
+    @property
+    def session(self):
+        # Built on first use (keeps requests unimported until then); the first
+        # prefetch batch asks from every pool thread at once, so only one builds it
+        if self._session is None:
+            with self._session_lock:
+                if self._session is None:
+                    self._session = _pooled_session(self._pool_size)
+        return self._session
+
+    def daily(self, d: dt_date):
+        """Daily feed as published for `d` (CNB answers with the last business day)."""
+        url = f"{self.base_url}denni_kurz.txt?date={d.strftime('%d.%m.%Y')}"
+        path = os.path.join(self.directory, "daily", f"{d.isoformat()}.txt")
+        return self._get(url, path, _is_daily, final=d < self._today())
+
+    def latest(self, refresh: bool = False):
+        """Newest daily feed; `refresh` revalidates now instead of waiting out the TTL."""
+        url = f"{self.base_url}denni_kurz.txt"
+        return self._get(url, os.path.join(self.directory, "latest.txt"), _is_daily, final=False, refresh=refresh)
+
+    def yearly(self, year: int):
+        url = f"{self.base_url}rok.txt?rok={year}"
+        path = os.path.join(self.directory, "year", f"{year}.txt")
+        return self._get(url, path, _is_yearly, final=year < self._today().year)
+
+    def _get(self, url: str, path: str, valid, final: bool, refresh: bool = False):
+        cached = _read(path)
+        if cached is not None and not valid(cached):
+            # Stored before bodies were checked; fetch it again
+            cached = None
+        meta_path = path + ".meta.json"
+        # A sidecar means the copy was fetched while the feed could still change
+        meta_raw = _read(meta_path)
+        if cached is not None and final and meta_raw is None:
+            return cached
+
+        meta = {}
+        if cached is not None:
+            try:
+                meta = json.loads(meta_raw or "{}")
+            except ValueError:
+                meta = {}
+            if not final and not refresh and self._clock() - meta.get("checked", 0) < self.ttl:
+                return cached
+
+        headers = {}
+        if cached is not None:
+            if meta.get("etag"):
+                headers["If-None-Match"] = meta["etag"]
+            if meta.get("last_modified"):
+                headers["If-Modified-Since"] = meta["last_modified"]
+        import requests
+        self.limiter.wait()
+        try:
+            r = self.session.get(url, headers=headers, timeout=self.timeout)
+        except requests.RequestException:
+            return cached
+
+        if r.status_code == 304 and cached is not None:
+            text = cached
+        elif r.status_code == 200:
+            text = r.content.decode("utf-8", errors="replace")
+            if not valid(text):
+                # A maintenance page served with 200; keep what we have
+                return cached
+            _write_atomic(path, text)
+            meta = {"etag": r.headers.get("ETag"), "last_modified": r.headers.get("Last-Modified")}
+        else:
+            return cached
+
+        if final:
+            if meta_raw is not None:
+                try:
+                    os.remove(meta_path)
+                except FileNotFoundError:
+                    pass
+        else:
+            meta["checked"] = self._clock()
+            _write_atomic(meta_path, json.dumps(meta))
+        return text
@@ -0,0 +1,167 @@
+"""Public holidays: built in for Czechia / Slovakia, Calendarific elsewhere.
+
+CZ and SK holidays are computed offline: fixed dates plus Good Friday and
+Easter Monday from the Gregorian computus, precomputed into one table per
+year. Other countries come from Calendarific, fetched once per (country,
+year) with a single year-wide request and kept on disk as JSON. Either way
+a lookup is a dict access indexed by ISO date.
+"""
+import json
+import os
+import threading
+from datetime import date as dt_date, timedelta
+from functools import lru_cache
+
+from expense_core.feed_cache import _write_atomic
+
+CALENDARIFIC_URL = "https://calendarific.com/api/v2/holidays"
+CACHE_DIR = os.getenv("HOLIDAY_CACHE_DIR", ".holiday_cache")
+
+# (month, day, name)
+_FIXED = {
+    "CZ": [
+        (1, 1, "Den obnovy samostatného českého státu, Nový rok"),
+        (5, 1, "Svátek práce"),
+        (5, 8, "Den vítězství"),
+        (7, 5, "Den slovanských věrozvěstů Cyrila a Metoděje"),
+        (7, 6, "Den upálení mistra Jana Husa"),
+        (9, 28, "Den české státnosti"),
+        (10, 28, "Den vzniku samostatného československého státu"),
+        (11, 17, "Den boje za svobodu a demokracii"),
+        (12, 24, "Štědrý den"),
+        (12, 25, "1. svátek vánoční"),
+        (12, 26, "2. svátek vánoční"),
+    ],
+    "SK": [
+        (1, 1, "Deň vzniku Slovenskej republiky"),
+        (1, 6, "Zjavenie Pána (Traja králi)"),
+        (5, 1, "Sviatok práce"),
+        (5, 8, "Deň víťazstva nad fašizmom"),
+        (7, 5, "Sviatok svätého Cyrila a Metoda"),
+        (8, 29, "Výročie Slovenského národného povstania"),
+        (9, 1, "Deň Ústavy Slovenskej republiky"),
+        (9, 15, "Sedembolestná Panna Mária"),
+        (11, 1, "Sviatok Všetkých svätých"),
+        (11, 17, "Deň boja za slobodu a demokraciu"),
+        (12, 24, "Štedrý deň"),
+        (12, 25, "Prvý sviatok vianočný"),
+        (12, 26, "Druhý sviatok vianočný"),
+    ],
+}
+# (days after Easter Sunday, name, first year)
+_EASTER = {
+    "CZ": [(-2, "Velký pátek", 2016), (1, "Velikonoční pondělí", None)],
+    "SK": [(-2, "Veľký piatok", None), (1, "Veľkonočný pondelok", None)],
+}
+BUILTIN_COUNTRIES = tuple(_FIXED)
+
+
+def easter_sunday(year: int) -> dt_date:
+    """Western Easter Sunday (anonymous Gregorian algorithm, Meeus/Jones/Butcher)."""
+    a = year % 19
+    b, c = divmod(year, 100)
+    d, e = divmod(b, 4)
+    f = (b + 8) // 25
+    g = (b - f + 1) // 3
+    h = (19 * a + b - d - g + 15) % 30
+    i, k = divmod(c, 4)
+    l = (32 + 2 * e + 2 * i - h - k) % 7
+    m = (a + 11 * h + 22 * l) // 451
+    month, day = divmod(h + l - 7 * m + 114, 31)
+    return dt_date(year, month, day + 1)
+
+
+def is_easter(d: dt_date) -> bool:
+    """Good Friday through Easter Monday."""
+    return -2 <= (d - easter_sunday(d.year)).days <= 1
+
+
+@lru_cache(maxsize=None)
+def builtin_year(country: str, year: int) -> dict:
+    """{ISO date: [holiday, ...]} for CZ / SK, records shaped like Calendarific's."""
+    days = {}
+
+    def put(d: dt_date, name: str):
+        days.setdefault(d.isoformat(), []).append({"name": name, "date": {"iso": d.isoformat()}, "country": country})
+
+    for month, day, name in _FIXED[country]:
+        put(dt_date(year, month, day), name)
+    sunday = easter_sunday(year)
+    for offset, name, since in _EASTER[country]:
+        if since is None or year >= since:
+            put(sunday + timedelta(days=offset), name)
+    return days
+
+
+def _index(holidays: list) -> dict:
+    """{ISO date: [holiday, ...]}; Calendarific's `date.iso` may carry a time part."""
+    out = {}
+    for h in holidays:
+        iso = (h.get("date") or {}).get("iso", "")[:10]
+        if iso:
+            out.setdefault(iso, []).append(h)
+    return out
+
+
+class HolidayCalendar:
+    def __init__(self, api_key: str, directory: str = CACHE_DIR, session=None, timeout: float = 10):
+        self.api_key = api_key
+        self.directory = directory
+        self._session = session
+        self.timeout = timeout
+        self._years = {}   # (country, year) -> {ISO date: [holiday, ...]}
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+
+    @property
+    def session(self):
+        if self._session is None:
+            import requests
+            self._session = requests.Session()
+        return self._session
+
+    def _path(self, country: str, year: int) -> str:
+        return os.path.join(self.directory, f"{country}-{year}.json")
+
+    def _fetch(self, country: str, year: int):
+        """Holiday list for a whole year, or None if the request failed."""
+        import requests
+        try:
+            r = self.session.get(
+                CALENDARIFIC_URL,
+                params={"api_key": self.api_key, "country": country, "year": year},
+                timeout=self.timeout,
+            )
+            if r.status_code != 200:
+                return None
+            return r.json().get("response", {}).get("holidays", [])
+        except (requests.RequestException, ValueError):
+            return None
+
+    def year(self, country: str, year: int) -> dict:
+        if country in BUILTIN_COUNTRIES:
+            return builtin_year(country, year)
+        key = (country, year)
+        days = self._years.get(key)
+        if days is not None:
+            return days
+        with self._lock:
+            if key in self._years:
+                return self._years[key]
+            path = self._path(country, year)
+            try:
+                with open(path, encoding="utf-8") as f:
+                    holidays = json.load(f)
+            except (OSError, ValueError):
+                holidays = self._fetch(country, year) if self.api_key else None
+                if holidays is not None:
+                    _write_atomic(path, json.dumps(holidays))
+            # Failed fetches are remembered for this process only, not on disk
+            days = self._years[key] = _index(holidays or [])
+        return days
+
+    def on(self, country: str, d: dt_date) -> list:
+        """Holidays on `d` in `country` (ISO 3166 code; None -> no holidays)."""
+        if country is None:
+            return []
+        return self.year(country, d.year).get(d.isoformat(), [])
@@ -0,0 +1,140 @@
+"""Bulk import of expenses exported by the app.
+
+The CSV uses the export layout (Date, Country, Currency, Amount, Category,
+Shop, Note); any computed columns in the file are ignored and recomputed.
+Conversion to CZK is one vectorized as-of join per currency against the
+local RateHistory followed by fixed-point integer conversion (`money`),
+and every missing publication date is fetched at most once, however many
+rows share it. A history with a year missing (the warm-up has not loaded
+it yet, or its bulk file failed) still holds rates around the gap, so the
+caller passes the years it holds and the importer fetches the others. Amounts are rounded to their currency's minor unit, the
+precision they are converted at.
+"""
+from datetime import date as dt_date
+
+import numpy as np
+import pandas as pd
+
+from expense_core import money
+from expense_core.rates import RateHistory
+from expense_core.warmup import fixing_on_or_before
+
+IMPORT_COLUMNS = ["Date", "Country", "Currency", "Amount", "Category", "Shop", "Note"]
+
+
+def read_expenses_csv(source) -> pd.DataFrame:
+    frame = pd.read_csv(source, dtype=str, keep_default_na=False)
+    missing = [c for c in ("Date", "Currency", "Amount") if c not in frame.columns]
+    if missing:
+        raise ValueError(f"Missing columns: {', '.join(missing)}")
+    for c in IMPORT_COLUMNS:
+        if c not in frame.columns:
+            frame[c] = ""
+    frame = frame[IMPORT_COLUMNS].copy()
+    frame["Date"] = pd.to_datetime(frame["Date"], format="ISO8601", errors="coerce").dt.normalize()
+    frame["Amount"] = pd.to_numeric(frame["Amount"].str.replace(",", "."), errors="coerce")
+    frame["Currency"] = frame["Currency"].str.strip().str.upper()
+    return frame
+
+
+def _foreign(frame: pd.DataFrame, today) -> pd.DataFrame:
+    return frame[(frame["Currency"] != "CZK") & (frame["Date"] <= pd.Timestamp(today))]
+
+
+def _fixing_year(day) -> int:
+    """Year of the fixing a purchase on `day` (datetime64[D]) is converted at."""
+    return fixing_on_or_before(day.astype(object)).year
+
+
+def _fixing_years(frame: pd.DataFrame, today) -> set:
+    days = _foreign(frame, today)["Date"].dropna().to_numpy(dtype="datetime64[D]")
+    return {_fixing_year(day) for day in np.unique(days)}
+
+
+def _missing_days(frame: pd.DataFrame, rates: RateHistory, today, unloaded=()):
+    """Distinct past purchase dates the local history cannot answer yet.
+
+    Dates converted at a fixing of an `unloaded` year count as missing even
+    when the history has rates on both sides of them.
+    """
+    foreign = _foreign(frame, today)
+    known = set(rates.currencies())
+    latest = np.datetime64(rates.latest, "D") if rates.latest else None
+    need = set()
+    for code, group in foreign.groupby("Currency"):
+        days = np.unique(group["Date"].dropna().to_numpy(dtype="datetime64[D]"))
+        if unloaded:
+            gap = np.array([_fixing_year(day) in unloaded for day in days], dtype=bool)
+            need.update(days[gap])
+            days = days[~gap]
+        series = rates.series(code)
+        if series is None:
+            # Codes CNB does not publish would be refetched for nothing
+            if not known:
+                need.update(days)
+            continue
+        need.update(days[(days < series[0][0]) | (days > latest)])
+    return sorted(need)
+
+
+def convert_to_czk(frame: pd.DataFrame, rates: RateHistory, fetch_day=None, fetch_year=None, today=None,
+                   fetch_days=None, years=None):
+    """Add Converted_CZK / Rate_value / Rate_date to an imported frame.
+
+    Dates `rates` cannot answer are filled first from yearly bulk files
+    (`fetch_year(year)`, one request per year) and then from daily feeds,
+    either as one batch (`fetch_days(dates)`, e.g. RatePrefetcher.fetch_days)
+    or one by one (`fetch_day(date)`, e.g. FeedCache.daily). `years` are the
+    years whose bulk file `rates` already holds (RateWarmer.years); when
+    given, every other year the import touches is fetched too.
+    Returns (converted rows, number of rows without a rate).
+    """
+    today = today or dt_date.today()
+    unloaded = _fixing_years(frame, today) - set(years) if years is not None else set()
+    if fetch_year is not None:
+        missing = {day.astype(object).year for day in _missing_days(frame, rates, today)}
+        for year in sorted(unloaded | missing):
+            if rates.add_yearly(fetch_year(year)):
+                unloaded.discard(year)
+    if fetch_days is not None or fetch_day is not None:
+        # Days of a year whose bulk file could not be fetched go one by one
+        days = [day.astype(object) for day in _missing_days(frame, rates, today, unloaded)]
+        for txt in fetch_days(days) if fetch_days is not None else map(fetch_day, days):
+            rates.add_daily(txt)
+
+    n = len(frame)
+    per_unit = np.full(n, np.nan)
+    haler = np.full(n, money.MISSING, dtype=np.int64)
+    rate_day = np.full(n, np.datetime64("NaT"), dtype="datetime64[D]")
+    dates = frame["Date"].to_numpy(dtype="datetime64[D]")
+    codes = frame["Currency"].to_numpy()
+    amounts = frame["Amount"].to_numpy(dtype=float).copy()
+
+    czk = codes == "CZK"
+    per_unit[czk] = 1.0
+    haler[czk] = money.to_minor(amounts[czk])
+    rate_day[czk] = dates[czk]
+    for code in pd.unique(codes[~czk]):
+        series = rates.series(code)
+        if series is None:
+            continue
+        days, values, qtys = series
+        rows = np.flatnonzero((codes == code) & ~np.isnat(dates))
+        idx = np.searchsorted(days, dates[rows], side="right") - 1
+        ok = idx >= 0
+        rows, idx = rows[ok], idx[ok]
+        unit = money.scale(code)
+        amounts[rows] = money.round_amount(amounts[rows], code)
+        haler[rows] = money.convert_minor(
+            money.to_minor(amounts[rows], unit), unit, money.to_minor(values[idx], money.RATE_SCALE), qtys[idx])
+        per_unit[rows] = values[idx] / qtys[idx]
+        rate_day[rows] = days[idx]
+
+    out = frame.copy()
+    out["Amount"] = amounts
+    out["Converted_CZK"] = money.from_minor(haler)
+    out["Rate_value"] = per_unit.round(4)
+    out["Rate_date"] = rate_day
+    # Unparseable dates / amounts count as skipped like rows without a rate
+    ok = ~np.isnan(per_unit) & ~np.isnat(dates) & (haler != money.MISSING)
+    return out[ok].reset_index(drop=True), int(n - ok.sum())
@@ -0,0 +1,164 @@
+"""Append-only expense ledger.
+
+`pd.concat` on every saved purchase copies the whole frame, so building an
+N-row diary costs O(N²). The ledger keeps rows in preallocated per-column
+chunks instead (amortized O(1) appends) and builds a DataFrame only when the
+table, summary or export asks for one.
+
+Every insert is coerced to a fixed schema: dates as `datetime64[D]`,
+Country / Currency / Category as small integer codes into a per-column
+category list (pandas `category` in the view), Amount and Converted_CZK as
+int64 hundredths (see `money`), rates as float64. Only Shop and Note stay
+Python strings.
+"""
+import numpy as np
+import pandas as pd
+
+from expense_core import money
+
+EXPENSE_SCHEMA = {
+    "Date": "date",
+    "Country": "category",
+    "Currency": "category",
+    "Amount": "money",
+    "Category": "category",
+    "Shop": "text",
+    "Note": "text",
+    "Converted_CZK": "money",
+    "Rate_value": "float",
+    "Rate_date": "date",
+}
+EXPENSE_COLUMNS = list(EXPENSE_SCHEMA)
+
+CHUNK_ROWS = 4096
+
+# kind -> (chunk dtype, fill value)
+_STORAGE = {
+    "date": ("datetime64[D]", np.datetime64("NaT")),
+    "category": (np.int16, -1),
+    "money": (np.int64, money.MISSING),
+    "float": (np.float64, np.nan),
+    "text": (object, None),
+}
+
+
+class Ledger:
+    """Chunked column store with a cached DataFrame view.
+
+    `version` grows with every insert, so callers can key their own caches on it.
+    """
+
+    def __init__(self, schema: dict = EXPENSE_SCHEMA, chunk_rows: int = CHUNK_ROWS):
+        self.schema = dict(schema)
+        self.columns = list(schema)
+        self._chunk_rows = chunk_rows
+        self._categories = {c: [] for c, kind in self.schema.items() if kind == "category"}
+        self._codes = {c: {} for c in self._categories}
+        self._sealed = []          # full chunks: dict column -> ndarray
+        self._tail = self._new_chunk()
+        self._fill = 0
+        self.version = 0
+        self._frame = None
+        self._frame_version = -1
+
+    def _new_chunk(self) -> dict:
+        chunk = {}
+        for c, kind in self.schema.items():
+            dtype, fill = _STORAGE[kind]
+            chunk[c] = np.full(self._chunk_rows, fill, dtype=dtype)
+        return chunk
+
+    def __len__(self) -> int:
+        return len(self._sealed) * self._chunk_rows + self._fill
+
+    @property
+    def empty(self) -> bool:
+        return len(self) == 0
+
+    def _code(self, column: str, value) -> int:
+        codes = self._codes[column]
+        code = codes.get(value)
+        if code is None:
+            code = codes[value] = len(self._categories[column])
+            self._categories[column].append(value)
+        return code
+
+    def _coerce(self, column: str, value):
+        kind = self.schema[column]
+        if kind == "date":
+            return np.datetime64(value, "D")
+        if kind == "category":
+            return self._code(column, value)
+        if kind == "money":
+            return money.to_minor(value)[0]
+        if kind == "float":
+            return float(value)
+        return value
+
+    def _coerce_column(self, column: str, values: pd.Series) -> np.ndarray:
+        kind = self.schema[column]
+        if kind == "date":
+            return pd.to_datetime(values, errors="coerce").to_numpy(dtype="datetime64[D]")
+        if kind == "category":
+            present = values.notna().to_numpy()
+            for value in pd.unique(values[present]):
+                self._code(column, value)
+            codes = np.full(len(values), -1, dtype=np.int16)
+            codes[present] = values[present].map(self._codes[column]).to_numpy(dtype=np.int16)
+            return codes
+        if kind in ("money", "float"):
+            values = pd.to_numeric(values, errors="coerce").to_numpy(dtype=np.float64)
+            return money.to_minor(values) if kind == "money" else values
+        return values.to_numpy(dtype=object)
+
+    def _seal_if_full(self):
+        if self._fill == self._chunk_rows:
+            self._sealed.append(self._tail)
+            self._tail = self._new_chunk()
+            self._fill = 0
+
+    def append(self, row: dict):
+        self._seal_if_full()
+        for c in self.columns:
+            value = row.get(c)
+            if value is not None:
+                self._tail[c][self._fill] = self._coerce(c, value)
+        self._fill += 1
+        self.version += 1
+
+    def extend(self, frame: pd.DataFrame):
+        """Bulk insert; columns are coerced once and copied slice-wise into the chunks."""
+        n = len(frame)
+        if n == 0:
+            return
+        arrays = {c: self._coerce_column(c, frame[c]) for c in self.columns if c in frame}
+        pos = 0
+        while pos < n:
+            self._seal_if_full()
+            take = min(n - pos, self._chunk_rows - self._fill)
+            for c, values in arrays.items():
+                self._tail[c][self._fill:self._fill + take] = values[pos:pos + take]
+            self._fill += take
+            pos += take
+        self.version += 1
+
+    def _column(self, c: str):
+        values = np.concatenate([chunk[c] for chunk in self._sealed] + [self._tail[c][:self._fill]])
+        if self.schema[c] == "money":
+            return money.from_minor(values)
+        if self.schema[c] != "category":
+            return values
+        # Sorted categories, so sorting the view by this column is alphabetical
+        categories = self._categories[c]
+        order = sorted(range(len(categories)), key=lambda i: str(categories[i]))
+        remap = np.empty(len(categories) + 1, dtype=np.int16)
+        remap[order] = np.arange(len(categories), dtype=np.int16)
+        remap[-1] = -1
+        return pd.Categorical.from_codes(remap[values], [categories[i] for i in order])
+
+    def to_frame(self) -> pd.DataFrame:
+        """DataFrame view of all rows; rebuilt only after new inserts."""
+        if self._frame_version != self.version:
+            self._frame = pd.DataFrame({c: self._column(c) for c in self.columns}, columns=self.columns)
+            self._frame_version = self.version
+        return self._frame
@@ -0,0 +1,21 @@
+"""Small LRU for values derived from a ledger version.
+
+Keys include the ledger version, so an insert makes every older entry
+unreachable and it simply ages out.
+"""
+from collections import OrderedDict
+
+
+class Memo:
+    def __init__(self, maxsize: int = 32):
+        self._cache = OrderedDict()
+        self._maxsize = maxsize
+
+    def get(self, key, build):
+        if key in self._cache:
+            self._cache.move_to_end(key)
+            return self._cache[key]
+        value = self._cache[key] = build()
+        if len(self._cache) > self._maxsize:
+            self._cache.popitem(last=False)
+        return value
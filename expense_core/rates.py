@@ -0,0 +1,167 @@
+"""Local history of CNB exchange rates with as-of lookups.
+
+Rates come from the CNB TXT feeds:
+
+* daily feed (`denni_kurz.txt`)::
+
+    02.01.2024 #1
+    země|měna|množství|kód|kurz
+    EMU|euro|1|EUR|24,685
+
+* yearly bulk file (`rok.txt?rok=2024`)::
+
+    Datum|1 AUD|1 EUR|100 HUF|...
+    02.01.2024|15,228|24,685|6,456|...
+
+Each currency is kept as sorted NumPy arrays (dates, rate, qty), so an
+as-of lookup is a bisect to the last rate published on or before a date.
+"""
+import threading
+from datetime import date as dt_date, datetime
+
+import numpy as np
+
+
+def _parse_day(s: str) -> dt_date:
+    return datetime.strptime(s.strip(), "%d.%m.%Y").date()
+
+
+def _to_float(s: str) -> float:
+    return float(s.strip().replace(",", "."))
+
+
+def _daily_lines(txt: str):
+    """(qty, code, rate) strings for every currency line of a daily feed."""
+    for line in txt.splitlines()[2:]:
+        parts = line.strip().split("|")
+        # Format: Country|Currency|Amount|Code|Rate
+        if len(parts) == 5:
+            _, _, qty, code, rate = parts
+            yield qty, code, rate
+
+
+def parse_rate_from_txt(txt: str, code: str):
+    """(rate, qty, header_date) for one currency of a daily feed."""
+    if not txt:
+        return None, None, None
+    lines = txt.splitlines()
+    header_date = lines[0].split(" #")[0].strip() if lines else None
+    for qty, c_code, rate in _daily_lines(txt):
+        if c_code == code:
+            try:
+                return _to_float(rate), _to_float(qty), header_date
+            except ValueError:
+                return None, None, header_date
+    return None, None, header_date
+
+
+def parse_daily_txt(txt: str):
+    """Publication date and {code: (rate, qty)} of a daily feed."""
+    if not txt:
+        return None, {}
+    try:
+        day = _parse_day(txt.splitlines()[0].split(" #")[0])
+    except (IndexError, ValueError):
+        return None, {}
+    rates = {}
+    for qty, code, rate in _daily_lines(txt):
+        try:
+            rates[code] = (_to_float(rate), _to_float(qty))
+        except ValueError:
+            continue
+    return day, rates
+
+
+def parse_yearly_txt(txt: str):
+    """Yield (date, {code: (rate, qty)}) rows of a yearly bulk file.
+
+    The header (`Datum|1 AUD|...`) may repeat mid-file when the currency
+    set changes, so columns are re-read whenever it appears.
+    """
+    columns = []
+    for line in (txt or "").splitlines():
+        parts = line.strip().split("|")
+        if not parts or not parts[0]:
+            continue
+        if parts[0] == "Datum":
+            columns = []
+            for head in parts[1:]:
+                qty, _, code = head.partition(" ")
+                columns.append((code, _to_float(qty)))
+            continue
+        try:
+            day = _parse_day(parts[0])
+        except ValueError:
+            continue
+        rates = {}
+        for (code, qty), cell in zip(columns, parts[1:]):
+            if cell.strip():
+                rates[code] = (_to_float(cell), qty)
+        yield day, rates
+
+
+class RateHistory:
+    """Per-currency sorted arrays of published CNB rates."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._points = {}      # code -> {date: (rate, qty)}
+        self._arrays = {}      # code -> (dates datetime64[D], rates, qtys)
+        self._dirty = set()
+        self.latest = None     # newest publication date seen
+
+    def __len__(self) -> int:
+        return sum(len(p) for p in self._points.values())
+
+    def currencies(self):
+        return sorted(self._points)
+
+    def add(self, day: dt_date, rates: dict):
+        with self._lock:
+            for code, value in rates.items():
+                self._points.setdefault(code, {})[day] = value
+                self._dirty.add(code)
+            if rates and (self.latest is None or day > self.latest):
+                self.latest = day
+
+    def add_daily(self, txt: str):
+        day, rates = parse_daily_txt(txt)
+        if day is not None:
+            self.add(day, rates)
+        return day
+
+    def add_yearly(self, txt: str) -> int:
+        """Add every row of a yearly bulk file; returns the number of days read."""
+        days = 0
+        for day, rates in parse_yearly_txt(txt):
+            self.add(day, rates)
+            days += 1
+        return days
+
+    def _series(self, code: str):
+        if code in self._dirty:
+            with self._lock:
+                points = self._points[code]
+                days = sorted(points)
+                self._arrays[code] = (
+                    np.array(days, dtype="datetime64[D]"),
+                    np.array([points[x][0] for x in days], dtype=np.float64),
+                    np.array([points[x][1] for x in days], dtype=np.float64),
+                )
+                self._dirty.discard(code)
+        return self._arrays.get(code)
+
+    def as_of(self, code: str, d: dt_date):
+        """(rate, qty, rate_date) last published on or before `d`, else Nones."""
+        series = self._series(code)
+        if series is None:
+            return None, None, None
+        days, rates, qtys = series
+        i = int(np.searchsorted(days, np.datetime64(d, "D"), side="right")) - 1
+        if i < 0:
+            return None, None, None
+        return float(rates[i]), float(qtys[i]), days[i].astype(object)
+
+    def series(self, code: str):
+        """(dates, rates, qtys) arrays for vectorized as-of joins."""
+        return self._series(code)
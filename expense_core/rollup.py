@@ -0,0 +1,104 @@
+"""Pre-aggregated (year, month, category, currency) rollup.
+
+Maintained incrementally as rows are saved, so switching the summary
+filter between months or categories is a dictionary lookup instead of
+parsing the Date column and re-grouping the whole ledger. Money is held
+in integer hundredths, so the totals are exact.
+"""
+import numpy as np
+import pandas as pd
+
+from expense_core import money
+
+
+def _year_month(day) -> tuple:
+    if isinstance(day, str):
+        return int(day[:4]), int(day[5:7])
+    return day.year, day.month
+
+
+class RollupCube:
+    """(year, month) -> {(category, currency): [czk, amount, count]}, money in hundredths."""
+
+    def __init__(self):
+        self._periods = {}
+
+    def _cell(self, year: int, month: int, category: str, currency: str) -> list:
+        cells = self._periods.setdefault((year, month), {})
+        cell = cells.get((category, currency))
+        if cell is None:
+            cell = cells[(category, currency)] = [0, 0, 0]
+        return cell
+
+    def add(self, day, category: str, currency: str, amount: float, converted: float):
+        amount, converted = money.to_minor([amount, converted])
+        self.merge(*_year_month(day), category, currency, amount, converted, 1)
+
+    def merge(self, year: int, month: int, category: str, currency: str,
+              amount: int, converted: int, count: int):
+        """Fold in an already aggregated cell, money in hundredths (bulk import, SQL seed)."""
+        cell = self._cell(int(year), int(month), category, currency)
+        cell[0] += int(converted)
+        cell[1] += int(amount)
+        cell[2] += int(count)
+
+    def add_frame(self, frame: pd.DataFrame):
+        """Roll up a batch of new rows (bulk import)."""
+        if frame.empty:
+            return
+        dates = pd.to_datetime(frame["Date"])
+        keys = frame.assign(
+            _year=dates.dt.year,
+            _month=dates.dt.month,
+            _czk=money.to_minor(frame["Converted_CZK"].to_numpy(dtype=float)),
+            _amount=money.to_minor(frame["Amount"].to_numpy(dtype=float)),
+        )
+        grouped = keys.groupby(["_year", "_month", "Category", "Currency"], observed=True)
+        sums = grouped[["_czk", "_amount"]].sum()
+        sums["count"] = grouped.size()
+        for (year, month, category, currency), row in sums.iterrows():
+            self.merge(year, month, category, currency, row["_amount"], row["_czk"], row["count"])
+
+    def years(self) -> list:
+        return sorted({y for y, _ in self._periods}, reverse=True)
+
+    def months(self, year=None) -> list:
+        return sorted({m for y, m in self._periods if year is None or y == year})
+
+    def categories(self) -> list:
+        return sorted({c for cells in self._periods.values() for c, _ in cells})
+
+    def _select(self, year, month) -> list:
+        if year is not None and month is not None:
+            return [self._periods.get((year, month), {})]
+        return [
+            cells for (y, m), cells in self._periods.items()
+            if (year is None or y == year) and (month is None or m == month)
+        ]
+
+    def total(self, year=None, month=None, category=None) -> float:
+        """Exact CZK total of a period (optionally one category)."""
+        haler = sum(
+            czk for cells in self._select(year, month)
+            for (cat, _), (czk, _, _) in cells.items()
+            if category is None or cat == category
+        )
+        return haler / money.CZK_SCALE
+
+    def slice(self, year=None, month=None, category=None) -> pd.DataFrame:
+        """Totals for a period, by Category (or by Currency within one category)."""
+        key = "Category" if category is None else "Currency"
+        out = {}
+        for cells in self._select(year, month):
+            for (cat, cur), (czk, _, count) in cells.items():
+                if category is not None and cat != category:
+                    continue
+                acc = out.setdefault(cat if category is None else cur, [0, 0])
+                acc[0] += czk
+                acc[1] += count
+        frame = pd.DataFrame(
+            [(k, v[0], v[1]) for k, v in out.items()],
+            columns=[key, "Converted_CZK", "Count"],
+        )
+        frame["Converted_CZK"] = money.from_minor(frame["Converted_CZK"].to_numpy(dtype=np.int64))
+        return frame
@@ -0,0 +1,106 @@
+"""Expense storage in an embedded SQLite database (WAL mode).
+
+The session ledger is only a view; this store keeps the history across
+restarts and seeds the running aggregates of a new session with indexed
+SQL aggregates instead of full-frame pandas scans.
+
+Persistence is opt-in: one file is shared by every session of the server,
+so it is only used when EXPENSES_DB names it (a private deployment).
+Without it the apps keep no store at all: a session's purchases live in its
+ledger only, and a public deployment never shows one visitor's purchases
+to another. The in-memory default is for tests and tools.
+"""
+import os
+import sqlite3
+import threading
+
+import pandas as pd
+
+from expense_core.ledger import EXPENSE_COLUMNS
+
+DB_PATH = os.getenv("EXPENSES_DB")     # unset = no store, purchases stay in the session
+MEMORY = ":memory:"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS expenses (
+    id INTEGER PRIMARY KEY,
+    Date TEXT NOT NULL,
+    Country TEXT,
+    Currency TEXT NOT NULL,
+    Amount REAL,
+    Category TEXT,
+    Shop TEXT,
+    Note TEXT,
+    Converted_CZK REAL,
+    Rate_value REAL,
+    Rate_date TEXT
+);
+CREATE INDEX IF NOT EXISTS ix_expenses_date ON expenses (Date);
+CREATE INDEX IF NOT EXISTS ix_expenses_category ON expenses (Category, Converted_CZK);
+CREATE INDEX IF NOT EXISTS ix_expenses_currency ON expenses (Currency);
+"""
+
+# Money columns are REAL; aggregates sum them as integer hundredths so the
+# seeds are exact (SQLite ROUND is half away from zero, like money.to_minor)
+_HALER = "CAST(ROUND(Converted_CZK * 100) AS INTEGER)"
+_CENTS = "CAST(ROUND(COALESCE(Amount, 0) * 100) AS INTEGER)"
+# Rows stored before imports were validated may lack a conversion; a NULL
+# sum would break the integer seeds, so the aggregates leave them out
+_CONVERTED = "WHERE Converted_CZK IS NOT NULL"
+
+
+def _sql_value(value):
+    """ISO strings for dates, NULL for NaN / NaT; other values pass through."""
+    if value is None or isinstance(value, str):
+        return value
+    if pd.isna(value):
+        return None
+    if hasattr(value, "strftime"):
+        return value.strftime("%Y-%m-%d")
+    return value
+
+
+class ExpenseStore:
+    """One connection per store; writes are serialized by a lock."""
+
+    def __init__(self, path: str = MEMORY):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+
+    def close(self):
+        self._conn.close()
+
+    def insert(self, row: dict):
+        self.insert_many([row])
+
+    def insert_many(self, rows):
+        placeholders = ", ".join("?" for _ in EXPENSE_COLUMNS)
+        sql = f"INSERT INTO expenses ({', '.join(EXPENSE_COLUMNS)}) VALUES ({placeholders})"
+        with self._lock, self._conn:
+            self._conn.executemany(sql, ([_sql_value(row.get(c)) for c in EXPENSE_COLUMNS] for row in rows))
+
+    def _query(self, sql: str, params=()) -> pd.DataFrame:
+        with self._lock:
+            return pd.read_sql_query(sql, self._conn, params=params)
+
+    def load(self) -> pd.DataFrame:
+        return self._query(f"SELECT {', '.join(EXPENSE_COLUMNS)} FROM expenses ORDER BY id")
+
+    def category_stats(self) -> pd.DataFrame:
+        """Category | sum | count | min | max of Converted_CZK in haléře (seeds CategoryStats)."""
+        return self._query(
+            f"SELECT Category, SUM({_HALER}), COUNT(*), MIN({_HALER}), MAX({_HALER}) "
+            f"FROM expenses {_CONVERTED} GROUP BY Category"
+        )
+
+    def rollup(self) -> pd.DataFrame:
+        """Year | Month | Category | Currency | amount | czk | count, money in hundredths (seeds RollupCube)."""
+        return self._query(
+            "SELECT CAST(substr(Date, 1, 4) AS INTEGER), CAST(substr(Date, 6, 2) AS INTEGER), "
+            f"Category, Currency, SUM({_CENTS}), SUM({_HALER}), COUNT(*) "
+            f"FROM expenses {_CONVERTED} GROUP BY 1, 2, 3, 4"
+        )
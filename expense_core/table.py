@@ -0,0 +1,54 @@
+"""Windowed purchase table.
+
+Sorting, searching and paging happen on the server and only the visible
+page is sent to `st.dataframe`, so the per-rerun payload stays bounded
+however long the history gets. Sort orders and page slices are cached
+per ledger version.
+"""
+import numpy as np
+import pandas as pd
+
+from expense_core.memo import Memo
+
+PAGE_SIZES = [25, 50, 100, 250]
+SEARCH_COLUMNS = ("Shop", "Note", "Category", "Country")
+
+
+class TableView:
+    """Sort orders and page slices, memoized per ledger version."""
+
+    def __init__(self, maxsize: int = 32):
+        self._memo = Memo(maxsize)
+
+    def order(self, frame: pd.DataFrame, version: int, sort_by: str, descending: bool, search: str = "") -> np.ndarray:
+        """Row positions matching `search`, in display order."""
+        def build():
+            rows = frame
+            if search:
+                hits = np.zeros(len(frame), dtype=bool)
+                for c in SEARCH_COLUMNS:
+                    if c in frame:
+                        hits |= frame[c].astype(str).str.contains(search, case=False, regex=False).to_numpy()
+                rows = frame[hits]
+            ordered = rows[sort_by].sort_values(ascending=not descending, kind="stable", na_position="last")
+            return ordered.index.to_numpy()
+        return self._memo.get(("order", version, sort_by, descending, search), build)
+
+    def page(self, frame: pd.DataFrame, version: int, sort_by: str, descending: bool, search: str,
+             page: int, page_size: int) -> pd.DataFrame:
+        def build():
+            order = self.order(frame, version, sort_by, descending, search)
+            return frame.iloc[order[page * page_size:(page + 1) * page_size]]
+        return self._memo.get(("page", version, sort_by, descending, search, page, page_size), build)
+
+    def page_of_date(self, frame: pd.DataFrame, version: int, descending: bool, search: str,
+                     day, page_size: int) -> int:
+        """0-based page holding the first row of `day` when sorted by Date."""
+        order = self.order(frame, version, "Date", descending, search)
+        if len(order) == 0:
+            return 0
+        dates = frame["Date"].to_numpy()[order]
+        day = np.datetime64(day, "D")
+        hits = np.flatnonzero(dates <= day) if descending else np.flatnonzero(dates >= day)
+        pos = hits[0] if len(hits) else len(order) - 1
+        return int(pos // page_size)
@@ -0,0 +1,125 @@
+"""Per-stage timing spans for script runs.
+
+A Timeline belongs to one session. `begin()` / `end()` bracket a full
+script run; `run(label)` brackets a fragment rerun or a deferred download
+(and is an ordinary span when a run is already open); `span(name)` times
+one stage inside the open run. Finished runs stay in a short ring buffer
+for the debug panel and, given a log path, are appended to a JSON-lines
+file, one run per line.
+
+A disabled timeline hands out one shared no-op context manager, so
+instrumented code pays a method call per span.
+"""
+import contextlib
+import json
+import os
+import threading
+import time
+import uuid
+from collections import deque
+
+LOG_PATH = os.getenv("TIMING_LOG")      # JSON-lines file; unset = no log
+QUERY_PARAM = ("debug", "timing")       # ?debug=timing shows the panel
+KEEP = 20
+
+_NULL = contextlib.nullcontext()
+_LOG_LOCK = threading.Lock()            # sessions share the log file
+
+
+class Timeline:
+    def __init__(self, enabled: bool = False, log_path: str = LOG_PATH, app: str = None, keep: int = KEEP):
+        self.enabled = enabled
+        self.log_path = log_path
+        self.app = app
+        self.session = uuid.uuid4().hex[:8]
+        self.runs = deque(maxlen=keep)
+        self._local = threading.local()   # the open run of the script / download thread
+        self._script = None               # last begin() run, until end()
+
+    def _open(self):
+        return getattr(self._local, "run", None)
+
+    def begin(self, label: str = "script"):
+        """Open a full script run; a previous one that never reached end() is logged as interrupted."""
+        if not self.enabled:
+            return
+        # st.rerun() or a newer interaction stopped the previous run, which
+        # lived on another script thread
+        if self._script is not None:
+            self._finish(self._script, "interrupted")
+        self._script = self._start(label)
+
+    def _start(self, label: str) -> dict:
+        run = {"label": label, "ts": time.time(), "t0": time.perf_counter(), "depth": 0, "spans": []}
+        self._local.run = run
+        return run
+
+    def end(self, status: str = "ok"):
+        run = self._open()
+        if run is not None:
+            self._finish(run, status)
+
+    def _finish(self, run: dict, status: str):
+        if self._open() is run:
+            self._local.run = None
+        if self._script is run:
+            self._script = None
+        record = {
+            "ts": round(run["ts"], 3),
+            "app": self.app,
+            "session": self.session,
+            "label": run["label"],
+            "status": status,
+            "total_ms": round((time.perf_counter() - run["t0"]) * 1000, 3),
+            "spans": sorted(run["spans"], key=lambda s: s["start_ms"]),
+        }
+        self.runs.append(record)
+        if self.log_path:
+            with _LOG_LOCK, open(self.log_path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+    def span(self, name: str):
+        """Time one stage of the open run (no-op when disabled or outside a run)."""
+        if not self.enabled or self._open() is None:
+            return _NULL
+        return self._span(name)
+
+    @contextlib.contextmanager
+    def _span(self, name: str):
+        run = self._open()
+        depth = run["depth"]
+        run["depth"] = depth + 1
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            end = time.perf_counter()
+            run["depth"] = depth
+            run["spans"].append({
+                "name": name,
+                "depth": depth,
+                "start_ms": round((start - run["t0"]) * 1000, 3),
+                "ms": round((end - start) * 1000, 3),
+            })
+
+    def run(self, label: str):
+        """A run of its own (fragment rerun, download), or a span inside the open one."""
+        if not self.enabled:
+            return _NULL
+        if self._open() is not None:
+            return self._span(label)
+        return self._run(label)
+
+    @contextlib.contextmanager
+    def _run(self, label: str):
+        run = self._start(label)
+        try:
+            yield
+        except BaseException as e:
+            # st.rerun() leaves a fragment through RerunException
+            self._finish(run, "rerun" if type(e).__name__ == "RerunException" else "error")
+            raise
+        self._finish(run, "ok")
+
+    def to_jsonl(self) -> str:
+        return "".join(json.dumps(r, ensure_ascii=False) + "\n" for r in self.runs)
@@ -0,0 +1,434 @@
+"""Streamlit sections shared by CNB_test_app.py and vytah_test_app.py.
+
+Each app keeps its own page setup, texts and post-save messages, and calls
+these for the rest: process-wide resources, per-session state, the purchase
+form, bulk import, the paged table, the summary, the export and the timing
+panel. `texts` is the app's text table for the current language.
+
+Each section is a fragment and reruns on its own when one of its widgets
+changes. A save or an import touches every section, so it queues its
+messages and asks for one full rerun; the table, charts and exports are
+memoized on the ledger version, so that rerun rebuilds each of them once.
+"""
+import functools
+from datetime import date as dt_date
+
+import streamlit as st
+
+from expense_core.aggregates import CategoryStats
+from expense_core.catalog import CATEGORIES, COUNTRIES, COUNTRY_TO_CODE
+from expense_core.charts import FREQUENCIES, category_bar, spend_line, spend_over_time
+from expense_core.export import FORMATS, drop_incomplete, export_bytes, read_ledger
+from expense_core.feed_cache import FeedCache
+from expense_core.importer import convert_to_czk, read_expenses_csv
+from expense_core.ledger import Ledger
+from expense_core.memo import Memo
+from expense_core.money import convert_amount, round_amount
+from expense_core.prefetch import RatePrefetcher
+from expense_core.rates import RateHistory
+from expense_core.rollup import RollupCube
+from expense_core.storage import DB_PATH, ExpenseStore
+from expense_core.table import PAGE_SIZES, TableView
+from expense_core.timing import QUERY_PARAM, Timeline
+from expense_core.warmup import RateWarmer
+
+MIN_DATE = dt_date(2024, 1, 1)
+
+
+# ---------------------------
+# Process-wide resources
+# ---------------------------
+@st.cache_resource
+def _shared_store():
+    return ExpenseStore(DB_PATH)
+
+
+def get_store() -> ExpenseStore | None:
+    """The shared file store when EXPENSES_DB is set; None keeps the session's purchases in its ledger only."""
+    return _shared_store() if DB_PATH else None
+
+
+@st.cache_resource
+def get_feed_cache():
+    # Past dates are kept on disk for good, "latest" is revalidated (ETag / Last-Modified)
+    return FeedCache()
+
+
+@st.cache_resource
+def get_rate_history():
+    # Filled in the background by the warm-up scheduler below
+    return RateHistory()
+
+
+@st.cache_resource
+def get_warmer():
+    # Yearly bulk files since the earliest selectable date at startup, then the
+    # latest feed shortly after each CNB fixing (~14:30 Prague time)
+    return RateWarmer(get_feed_cache(), get_rate_history(), since=MIN_DATE.year).start()
+
+
+@st.cache_resource
+def get_prefetcher():
+    # Concurrent daily-feed backfill over the feed cache's pooled session
+    return RatePrefetcher(get_feed_cache())
+
+
+def get_rate_for(code: str, d: dt_date):
+    """(rate, qty, rate day) of `code` on `d`, or Nones when CNB has no rate for it."""
+    return get_warmer().rate_for(code, d, timeline())
+
+
+# ---------------------------
+# Timing spans (?debug=timing shows them, TIMING_LOG=path appends each run as a JSON line)
+# ---------------------------
+def debug_timing() -> bool:
+    return st.query_params.get(QUERY_PARAM[0]) == QUERY_PARAM[1]
+
+
+def timeline() -> Timeline:
+    return st.session_state["timeline"]
+
+
+def start_timeline(app: str) -> Timeline:
+    """The session's timeline, opened for this script run."""
+    if "timeline" not in st.session_state:
+        st.session_state["timeline"] = Timeline(app=app)
+    tl = st.session_state["timeline"]
+    tl.enabled = debug_timing() or bool(tl.log_path)
+    tl.begin()
+    return tl
+
+
+def timed(label: str):
+    """Run the function as `label` on the session's timeline (a span inside a full run)."""
+    def wrap(fn):
+        @functools.wraps(fn)
+        def timed_fn(*args, **kwargs):
+            with timeline().run(label):
+                return fn(*args, **kwargs)
+        return timed_fn
+    return wrap
+
+
+# ---------------------------
+# Session state
+# ---------------------------
+def init_state():
+    """Seed the ledger and the running aggregates of a new session from the store, if there is one."""
+    if "expenses" in st.session_state:
+        return
+    store = get_store()
+    ledger = Ledger()
+    stats = CategoryStats()
+    cube = RollupCube()
+    if store is not None:
+        with timeline().span("store.load"):
+            ledger.extend(store.load())
+        for row in store.category_stats().itertuples(index=False):
+            stats.merge(*row)
+        for row in store.rollup().itertuples(index=False):
+            cube.merge(*row)
+    st.session_state["expenses"] = ledger
+    st.session_state["category_stats"] = stats
+    st.session_state["rollup"] = cube
+    st.session_state["table_view"] = TableView()
+    st.session_state["charts"] = Memo()
+    st.session_state["exports"] = Memo(maxsize=4)
+
+
+def header(texts: dict):
+    st.title(texts["app_title"])
+    st.caption(texts["subtitle"])
+    rates_day = get_warmer().as_of
+    st.caption(texts["rates_as_of"].format(day=rates_day) if rates_day else texts["rates_loading"])
+
+
+def flash(kind: str, text: str):
+    """Queue a message (st.<kind>) for the next form render, surviving st.rerun()."""
+    st.session_state.setdefault("flash", []).append((kind, text))
+
+
+def show_flash():
+    for kind, text in st.session_state.pop("flash", []):
+        getattr(st, kind)(text)
+
+
+# ---------------------------
+# Input form
+# ---------------------------
+def _save(texts: dict, d: dt_date, country: str, category: str, amount: float, shop: str, note: str):
+    code = COUNTRY_TO_CODE[country]
+    # Stored at the precision it is converted at (whole yen, not hundredths)
+    amount = float(round_amount(amount, code)[0])
+    rate, qty, rate_date = get_rate_for(code, d)
+    if rate is None:
+        st.error(texts["rate_err"])
+        return None
+    converted = convert_amount(amount, code, rate, qty)
+    per_unit = rate / qty
+    row = {
+        "Date": d.isoformat(),
+        "Country": country,
+        "Currency": code,
+        "Amount": amount,
+        "Category": category,
+        "Shop": shop,
+        "Note": note,
+        "Converted_CZK": converted,
+        "Rate_value": round(per_unit, 4),
+        "Rate_date": rate_date
+    }
+    tl = timeline()
+    with tl.span("ledger.append"):
+        st.session_state["expenses"].append(row)
+    store = get_store()
+    if store is not None:
+        with tl.span("store.insert"):
+            store.insert(row)
+    with tl.span("aggregates.add"):
+        st.session_state["category_stats"].add(category, converted)
+        st.session_state["rollup"].add(d, category, code, amount, converted)
+    flash("success", f"{texts['saved_ok']} {converted} CZK "
+                     f"— {texts['rate_info']}: {round(per_unit,4)} CZK/1 {code} "
+                     f"({texts['rate_from']} {rate_date})")
+    return row
+
+
+@st.fragment
+@timed("form")
+def input_form(texts: dict, lang: str, on_saved=None):
+    """The purchase form; `on_saved(d, row)` queues the app's own messages after a save."""
+    show_flash()
+    with st.form("form"):
+        col1, col2 = st.columns(2)
+        with col1:
+            d = st.date_input(texts["date"], value=dt_date.today(), min_value=MIN_DATE)
+            country = st.selectbox(texts["country"], COUNTRIES[lang])
+            category = st.selectbox(texts["category"], CATEGORIES[lang])
+        with col2:
+            amount = st.number_input(texts["amount"], min_value=0.0, step=1.0)
+            shop = st.text_input(texts["shop"])
+            note = st.text_input(texts["note"])
+        submit = st.form_submit_button(texts["save"])
+
+    if submit:
+        row = _save(texts, d, country, category, amount, shop, note)
+        if row is not None:
+            if on_saved is not None:
+                on_saved(d, row)
+            st.rerun()
+
+
+# ---------------------------
+# Bulk import (CSV in the export layout, or a Parquet / Arrow export)
+# ---------------------------
+@st.fragment
+@timed("import")
+def bulk_import(texts: dict):
+    tl = timeline()
+    with st.expander(texts["import"]):
+        upload = st.file_uploader(texts["import"], type=list(FORMATS), label_visibility="collapsed")
+        if upload is not None and st.button(texts["import_btn"]):
+            fmt = upload.name.rsplit(".", 1)[-1].lower()
+            try:
+                with tl.span("import.read"):
+                    rows = read_expenses_csv(upload) if fmt == "csv" else read_ledger(upload.getvalue(), fmt)
+            except ValueError as e:
+                st.error(str(e))
+            else:
+                if "Converted_CZK" in rows:
+                    # Typed exports already carry the conversion; rows missing it are skipped
+                    converted, skipped = drop_incomplete(rows)
+                else:
+                    with tl.span("import.convert"):
+                        converted, skipped = convert_to_czk(rows, get_rate_history(), fetch_year=get_feed_cache().yearly,
+                                                            fetch_days=get_prefetcher().fetch_days,
+                                                            years=get_warmer().years)
+                with tl.span("ledger.extend"):
+                    st.session_state["expenses"].extend(converted)
+                store = get_store()
+                if store is not None:
+                    with tl.span("store.insert_many"):
+                        store.insert_many(converted.to_dict("records"))
+                with tl.span("aggregates.add_frame"):
+                    st.session_state["category_stats"].add_frame(converted)
+                    st.session_state["rollup"].add_frame(converted)
+                flash("success", texts["import_ok"].format(n=len(converted)))
+                if skipped:
+                    flash("warning", texts["import_skipped"].format(n=skipped))
+                st.rerun()
+
+
+# ---------------------------
+# Table + summary + export
+# ---------------------------
+def jump_to_date():
+    # Switch to date order and open the page holding the picked day
+    day = st.session_state.get("table_jump")
+    if day is None:
+        return
+    ledger = st.session_state["expenses"]
+    st.session_state["table_sort"] = "Date"
+    st.session_state["table_page"] = 1 + st.session_state["table_view"].page_of_date(
+        ledger.to_frame(), ledger.version, st.session_state.get("table_desc", True),
+        st.session_state.get("table_search", ""), day, st.session_state.get("table_page_size", PAGE_SIZES[0]),
+    )
+
+
+@st.fragment
+@timed("table")
+def purchase_table(texts: dict):
+    tl = timeline()
+    ledger = st.session_state["expenses"]
+    with tl.span("ledger.to_frame"):
+        df = ledger.to_frame()
+    st.subheader(texts["list"])
+    t1, t2, t3, t4 = st.columns(4)
+    with t1:
+        page_size = st.selectbox(texts["page_size"], PAGE_SIZES, key="table_page_size")
+    with t2:
+        sort_by = st.selectbox(texts["sort_by"], ledger.columns, key="table_sort")
+    with t3:
+        search = st.text_input(texts["search"], key="table_search")
+    with t4:
+        descending = st.checkbox(texts["descending"], value=True, key="table_desc")
+
+    view = st.session_state["table_view"]
+    with tl.span("table.order"):
+        matched = len(view.order(df, ledger.version, sort_by, descending, search))
+    pages = max(1, -(-matched // page_size))
+    if st.session_state.get("table_page", 1) > pages:
+        st.session_state["table_page"] = pages
+    p1, p2 = st.columns(2)
+    with p1:
+        page = st.number_input(texts["page"], min_value=1, max_value=pages, step=1, key="table_page")
+    with p2:
+        st.date_input(texts["jump"], value=None, min_value=MIN_DATE, key="table_jump", on_change=jump_to_date)
+    with tl.span("table.render"):
+        st.dataframe(
+            view.page(df, ledger.version, sort_by, descending, search, page - 1, page_size),
+            use_container_width=True,
+            column_config={c: st.column_config.DateColumn(c) for c in ("Date", "Rate_date")},
+        )
+    st.caption(f"{texts['page']} {page}/{pages} · {matched} {texts['rows']}")
+
+
+@st.fragment
+@timed("summary")
+def summary(texts: dict, lang: str):
+    tl = timeline()
+    ledger = st.session_state["expenses"]
+    with tl.span("ledger.to_frame"):
+        df = ledger.to_frame()
+    st.subheader(texts["summary"])
+    cube = st.session_state["rollup"]
+    all_label = texts["all"]
+    st.markdown(f"**{texts['filter']}**")
+    f1, f2, f3 = st.columns(3)
+    with f1:
+        year = st.selectbox(texts["yr"], [all_label] + cube.years(), key="filter_year")
+        year = None if year == all_label else year
+    with f2:
+        month = st.selectbox(texts["mo"], [all_label] + cube.months(year), key="filter_month")
+        month = None if month == all_label else month
+    with f3:
+        cat = st.selectbox(texts["category"], [all_label] + cube.categories(), key="filter_category")
+        cat = None if cat == all_label else cat
+
+    if year is None and month is None and cat is None:
+        stats = st.session_state["category_stats"]
+        total, grouped = stats.total, stats.to_frame
+    else:
+        total, grouped = cube.total(year, month, cat), lambda: cube.slice(year, month, cat)
+    st.metric(texts["total"], f"{total:.2f} CZK")
+
+    # Per category, or per currency once a single category is picked
+    group_col = "Category" if cat is None else "Currency"
+    # Chart specs are rebuilt only when the ledger, language or filter changes
+    charts = st.session_state["charts"]
+    filters = (year, month, cat)
+    with tl.span("chart.bar"):
+        chart = charts.get(("bar", ledger.version, lang) + filters, lambda: category_bar(
+            grouped(), group_col, texts["category" if cat is None else "currency"]))
+        st.altair_chart(chart, use_container_width=True)
+
+    st.markdown(f"**{texts['trend']}**")
+    freq = st.radio(texts["trend"], FREQUENCIES, horizontal=True, key="trend_freq",
+                    format_func=lambda f: texts["daily" if f == "D" else "weekly"],
+                    label_visibility="collapsed")
+    with tl.span("chart.trend"):
+        trend = charts.get(("trend", ledger.version, freq) + filters, lambda: spend_line(
+            spend_over_time(df, freq, year, month, cat), freq))
+        st.altair_chart(trend, use_container_width=True)
+
+
+@st.fragment
+@timed("export")
+def export(texts: dict):
+    tl = timeline()
+    ledger = st.session_state["expenses"]
+    with tl.span("ledger.to_frame"):
+        df = ledger.to_frame()
+    e1, e2 = st.columns(2)
+    with e1:
+        fmt = st.selectbox(texts["format"], list(FORMATS), format_func=lambda f: FORMATS[f][0], key="export_format")
+    with e2:
+        compress = fmt == "csv" and st.checkbox(texts["gzip"], key="export_gzip")
+
+    def build_export(frame=df, version=ledger.version, fmt=fmt, compress=compress, exports=st.session_state["exports"],
+                     timeline=tl):
+        # Runs only on click, outside the script thread (so it is a run of its
+        # own on the timeline); cached until the ledger changes
+        with timeline.run(f"download.{fmt}"):
+            return exports.get((fmt, version, compress), lambda: export_bytes(frame, fmt, compress))
+
+    st.download_button(
+        label=texts["export"],
+        data=build_export,
+        file_name=f"expenses_{dt_date.today().isoformat()}.{fmt}" + (".gz" if compress else ""),
+        mime="application/gzip" if compress else FORMATS[fmt][1],
+        on_click="ignore",
+    )
+
+
+def ledger_views(texts: dict, lang: str):
+    """Table, then summary and export once there is something to summarise."""
+    purchase_table(texts)
+    if not st.session_state["expenses"].empty:
+        summary(texts, lang)
+        export(texts)
+
+
+# ---------------------------
+# Timing panel (?debug=timing)
+# ---------------------------
+@st.fragment
+def timing_panel():
+    # Its own reruns are not timed; "Refresh" picks up fragment reruns and downloads
+    tl = timeline()
+    with st.expander("⏱️ Timing", expanded=True):
+        runs = list(tl.runs)[::-1]
+        r1, r2 = st.columns([3, 1])
+        with r2:
+            st.button("Refresh", key="timing_refresh")
+            st.download_button("JSON lines", tl.to_jsonl, "timing.jsonl", "application/x-ndjson",
+                               key="timing_download", on_click="ignore")
+        if not runs:
+            return
+        with r1:
+            pick = st.selectbox("Run", range(len(runs)), key="timing_run", format_func=lambda i: (
+                f"{runs[i]['label']} · {runs[i]['total_ms']:.1f} ms · {runs[i]['status']}"))
+        run = runs[min(pick, len(runs) - 1)]
+        st.dataframe(
+            [{"stage": "· " * s["depth"] + s["name"], "start_ms": s["start_ms"], "ms": s["ms"]} for s in run["spans"]],
+            use_container_width=True, hide_index=True,
+        )
+        st.caption(f"session {tl.session} · {len(runs)} runs kept · "
+                   f"{sum(s['ms'] for s in run['spans'] if s['depth'] == 0):.1f} of {run['total_ms']:.1f} ms in top-level stages")
+
+
+def end_timeline():
+    """Close this script run; show the panel when asked for."""
+    timeline().end()
+    if debug_timing():
+        timing_panel()
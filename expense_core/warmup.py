@@ -0,0 +1,159 @@
+"""Background warm-up of the CNB rate history.
+
+CNB publishes the daily fixing once per business day shortly after 14:30
+Prague time. Instead of fetching on the first save of the day, a daemon
+thread loads the yearly files at startup and re-reads the latest feed a
+few minutes after every publication (retrying while CNB is late). A year
+whose bulk file could not be fetched is retried on the same schedule and
+until then is not covered. A save looks its rate up with `rate_for()`,
+which fetches the day's feed itself only when `covers(d)` is False (still
+starting up, a year missing, or the fixing is late).
+
+The clock and the wait are injectable, so the scheduler runs in tests with
+a fake clock against a local feed stand-in.
+"""
+import threading
+from contextlib import nullcontext
+from datetime import date as dt_date, datetime, time as dt_time, timedelta, timezone
+from zoneinfo import ZoneInfo
+
+from expense_core.feed_cache import FeedCache
+from expense_core.holidays import builtin_year
+from expense_core.rates import RateHistory
+
+PRAGUE = ZoneInfo("Europe/Prague")
+PUBLISHED_AT = dt_time(14, 30)
+REFRESH_AT = dt_time(14, 35)
+RETRY = 300            # seconds between refreshes while the new fixing is missing
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def is_fixing_day(d: dt_date) -> bool:
+    """CNB fixes rates on Czech business days."""
+    return d.weekday() < 5 and d.isoformat() not in builtin_year("CZ", d.year)
+
+
+def fixing_on_or_before(d: dt_date) -> dt_date:
+    while not is_fixing_day(d):
+        d -= timedelta(days=1)
+    return d
+
+
+def last_fixing(now: datetime) -> dt_date:
+    """Newest fixing CNB should have published by `now`."""
+    local = now.astimezone(PRAGUE)
+    day = local.date()
+    if local.time() < PUBLISHED_AT:
+        day -= timedelta(days=1)
+    return fixing_on_or_before(day)
+
+
+def next_refresh(now: datetime) -> datetime:
+    """First REFRESH_AT on a fixing day strictly after `now` (Prague wall clock)."""
+    local = now.astimezone(PRAGUE)
+    day = local.date()
+    if local.time() >= REFRESH_AT:
+        day += timedelta(days=1)
+    while not is_fixing_day(day):
+        day += timedelta(days=1)
+    return datetime.combine(day, REFRESH_AT, tzinfo=PRAGUE)
+
+
+class RateWarmer:
+    def __init__(self, feeds: FeedCache, rates: RateHistory, since: int = 2024, clock=_utcnow, wait=None):
+        self.feeds = feeds
+        self.rates = rates
+        self.since = since
+        self._clock = clock
+        self._stop = threading.Event()
+        self._wait = wait or self._stop.wait
+        self._thread = None
+        self.loaded = threading.Event()   # first load attempt is done
+        self.years = set()                # years whose bulk file is in
+
+    @property
+    def as_of(self):
+        """Publication date of the newest rates held (None while starting up)."""
+        return self.rates.latest if self.loaded.is_set() else None
+
+    @property
+    def ready(self) -> bool:
+        """True when the newest fixing published so far is loaded."""
+        return self.as_of is not None and self.as_of >= last_fixing(self._clock())
+
+    def covers(self, d: dt_date) -> bool:
+        """True when the rate for a purchase on `d` can be answered without a fetch."""
+        if self.as_of is None:
+            return False
+        fixing = fixing_on_or_before(d)
+        return fixing.year in self.years and self.as_of >= min(fixing, last_fixing(self._clock()))
+
+    def rate_for(self, code: str, d: dt_date, timeline=None):
+        """(rate, qty, rate day ISO) of `code` for a purchase on `d`, or Nones when CNB has none.
+
+        Feed fetches are timed as "rates.fetch" on `timeline`, if given.
+        """
+        if code == "CZK":
+            return 1.0, 1, d.isoformat()
+
+        def fetch():
+            with timeline.span("rates.fetch") if timeline is not None else nullcontext():
+                self.rates.add_daily(self.feeds.daily(d))
+
+        covered = self.covers(d)
+        if not covered:
+            fetch()
+        # Last rate published on or before d (previous business day on weekends/holidays)
+        rate, qty, rate_day = self.rates.as_of(code, d)
+        if rate is None and covered:
+            # The warmed-up history lacks this currency or day after all
+            fetch()
+            rate, qty, rate_day = self.rates.as_of(code, d)
+        if rate is None or not qty:
+            return None, None, None
+        return rate, qty, rate_day.isoformat()
+
+    def missing_years(self) -> list:
+        return [y for y in range(self.since, self._clock().astimezone(PRAGUE).year + 1) if y not in self.years]
+
+    def load_years(self):
+        """Fetch the bulk file of every year not loaded yet."""
+        for year in self.missing_years():
+            txt = self.feeds.yearly(year)
+            # None when CNB failed and nothing is cached; an error page is no bulk file either
+            if txt and txt.lstrip().startswith("Datum"):
+                self.rates.add_yearly(txt)
+                self.years.add(year)
+
+    def load(self):
+        self.load_years()
+        self.rates.add_daily(self.feeds.latest(refresh=True))
+        self.loaded.set()
+
+    def refresh(self):
+        self.load_years()
+        self.rates.add_daily(self.feeds.latest(refresh=True))
+
+    def delay(self) -> float:
+        """Seconds until the next refresh."""
+        now = self._clock()
+        if not self.ready or self.missing_years():
+            return RETRY
+        return max(0.0, (next_refresh(now) - now).total_seconds())
+
+    def run(self):
+        self.load()
+        while not self._wait(self.delay()):
+            self.refresh()
+
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self.run, name="cnb-warmup", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
@@ -1,13 +1,14 @@
 import streamlit as st
 from datetime import datetime
-import time
 import pandas as pd
 import random
 
+from expense_core.assets import picture
+
 # Nastavenie názvu aplikácie
 st.set_page_config(page_title="Výdavkový denník", page_icon="🛗")
 
-# Cesta k obrázkom
+# Obrázky z images_vytah_appka/ (zmenšené varianty zo static/, prehliadač si ich pamätá)
 IMG1 = "vytah_zavrete_dvere_obrazok1.png"
 IMG2 = "obrazok_vnutro_vytah_s_appko_obrazok2.JPG"
 IMG4 = "zavrete_dvere_vytah_ide_dole_obrazok4.png"
@@ -31,34 +32,73 @@ def issuecoin_hlaska(kategoria, suma):
         return random.choice(hlasky[kategoria])
     return ""
 
+# 🛗 Stavový automat výťahu (v session_state, nič v skripte nečaká):
+#   "otvara"    – po výbere dátumu: dvere sa otvárajú, potom vnútro, potom formulár
+#   "formular"  – bežné prekreslenie, všetko hneď bez animácie
+#   "odchadza"  – po uložení: výťah ide späť na prízemie
+# Oneskorenia robí prehliadač cez CSS animácie na kontajneroch s kľúčom,
+# takže server odpovie hneď a ďalšie kliknutia nečakajú.
+ANIMACIE = {
+    "otvara": """
+        .st-key-vytah_otvara {animation: vytah-skry 0s 2s both}
+        .st-key-vytah_vnutro {animation: vytah-zobraz .6s 2s both}
+        .st-key-vytah_formular {animation: vytah-zobraz .6s 4s both}
+    """,
+    "formular": "",
+    "odchadza": """
+        .st-key-vytah_odchod {animation: vytah-zobraz .6s 2s both}
+    """,
+}
+KEYFRAMES = """
+    @keyframes vytah-zobraz {from {opacity: 0; visibility: hidden} to {opacity: 1; visibility: visible}}
+    @keyframes vytah-skry {to {opacity: 0; visibility: hidden; height: 0; overflow: hidden}}
+"""
+
+def prechod(stav):
+    st.session_state["vytah"] = stav
+
+if "vytah" not in st.session_state:
+    prechod("otvara")
+
 # 🛗 Obrazovka 1 – Výber dátumu
-st.image(IMG1, use_column_width=True)
+st.markdown(picture(IMG1, "Výťah"), unsafe_allow_html=True)
 st.subheader("Vitaj vo výdavkovom výťahu 🛗")
-datum = st.date_input("Vyber dátum svojho nákupu", datetime.today())
+# Nový dátum = nová jazda výťahom
+datum = st.date_input("Vyber dátum svojho nákupu", datetime.today(), on_change=prechod, args=("otvara",))
 
 if datum:
-    with st.spinner("Výťah sa otvára..."):
-        time.sleep(2)
-    st.image(IMG2, use_column_width=True)
-    time.sleep(2)
+    stav = st.session_state["vytah"]
+
+    with st.container(key="vytah_otvara"):
+        if stav == "otvara":
+            st.info("⏳ Výťah sa otvára...")
+    with st.container(key="vytah_vnutro"):
+        st.markdown(picture(IMG2, "Vnútro výťahu"), unsafe_allow_html=True)
 
     # 🧾 Obrazovka 3 – Výdavková aplikácia
-    st.subheader("Zadaj svoje výdavky")
+    with st.container(key="vytah_formular"):
+        st.subheader("Zadaj svoje výdavky")
+
+        krajina = st.selectbox("Vyber krajinu", ["Česká republika", "Slovensko", "Rakúsko"])
+        kategoria = st.selectbox("Vyber kategóriu", ["Potraviny", "Oblečenie", "Bývanie", "Zábava", "Iné"])
+        suma = st.number_input("Zadaj sumu výdavku", min_value=0)
 
-    krajina = st.selectbox("Vyber krajinu", ["Česká republika", "Slovensko", "Rakúsko"])
-    kategoria = st.selectbox("Vyber kategóriu", ["Potraviny", "Oblečenie", "Bývanie", "Zábava", "Iné"])
-    suma = st.number_input("Zadaj sumu výdavku", min_value=0)
+        if st.button("Uložiť výdavok"):
+            stav = "odchadza"
+            st.success(f"Výdavok {suma} Kč v kategórii {kategoria} bol uložený.")
 
-    if st.button("Uložiť výdavok"):
-        st.success(f"Výdavok {suma} Kč v kategórii {kategoria} bol uložený.")
+            # 💬 AI agent hláška
+            hlaska = issuecoin_hlaska(kategoria, suma)
+            if hlaska:
+                st.info(f"IssueCoin ti vraví: {hlaska}")
 
-        # 💬 AI agent hláška
-        hlaska = issuecoin_hlaska(kategoria, suma)
-        if hlaska:
-            st.info(f"IssueCoin ti vraví: {hlaska}")
+            # 📉 Môžeš sem doplniť aj ukladanie do CSV, grafy, atď.
+            with st.container(key="vytah_odchod"):
+                st.markdown(picture(IMG4, "Výťah ide dole"), unsafe_allow_html=True)
+                st.write("Výťah ide späť na prízemie... 👋")
 
-        # 📉 Môžeš sem doplniť aj ukladanie do CSV, grafy, atď.
-        time.sleep(2)
-        st.image(IMG4, use_column_width=True)
-        st.write("Výťah ide späť na prízemie... 👋")
+    if ANIMACIE[stav]:
+        st.html(f"<style>{KEYFRAMES}{ANIMACIE[stav]}</style>")
+    # Animácia sa prehrá raz; ďalšie prekreslenia idú rovno na formulár
+    prechod("formular")
 
@@ -1,6 +1,11 @@
+import os
+import sys
 import streamlit as st
 from datetime import date
-from PIL import Image
+
+# expense_core leží v koreni repozitára, o úroveň vyššie
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from expense_core.assets import picture
 
 # Nastavenie stránky
 st.set_page_config(page_title="Výdavkový denník", layout="centered")
@@ -8,9 +13,8 @@ st.set_page_config(page_title="Výdavkový denník", layout="centered")
 # Hlavička
 st.markdown("## 🛗 Výdavkový denník / Výdajový deník")
 
-# Načítanie obrázka výťahu (obrázok 1)
-image_path = "images_vytah_appka/vytah_zavrete_dvere_obrazok1.png"
-image = Image.open(image_path)
+# Obrázok výťahu (obrázok 1) – zmenšené varianty v static/ vedľa tohto skriptu
+image = picture("vytah_zavrete_dvere_obrazok1.png", "Výťah", root=os.path.dirname(os.path.abspath(__file__)))
 
 # Layout: Kalendár a jazykový prepínač zarovno s obrázkom
 col1, col2, col3 = st.columns([1, 2, 1])
@@ -31,7 +35,7 @@ with col3:
     st.write("")
 
 # Zobrazenie obrázka výťahu
-st.image(image, use_column_width=True)
+st.markdown(image, unsafe_allow_html=True)
 
 # Voliteľne: zobrazenie výberu jazyka a dátumu pod obrázkom
 st.write(f"🔤 Jazyk: **{language}**")
@@ -0,0 +1,45 @@
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+FIXTURES = os.path.join(ROOT, "bench", "fixtures")
+sys.path.insert(0, ROOT)
+
+
+def _fixture(name: str) -> str:
+    with open(os.path.join(FIXTURES, name), encoding="utf-8") as f:
+        return f.read()
+
+
+@pytest.fixture(scope="session")
+def _standin_server():
+    from bench import cnb_standin
+
+    server, base_url = cnb_standin.start()
+    yield server, base_url
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def standin(_standin_server):
+    """(server, base URL) of the local CNB stand-in (bench/cnb_standin.py), with fresh counters."""
+    server, _ = _standin_server
+    server.hits = 0
+    server.log = []
+    server.fail = None
+    return _standin_server
+
+
+@pytest.fixture(scope="session")
+def daily_txt() -> str:
+    """Sample CNB daily feed of 02.01.2024 (CNB layout, illustrative values)."""
+    return _fixture("denni_kurz.txt")
+
+
+@pytest.fixture(scope="session")
+def yearly_txt() -> str:
+    """Sample CNB yearly bulk file for 2024; its 02.01.2024 row matches the daily feed."""
+    return _fixture("rok-2024.txt")
@@ -0,0 +1,121 @@
+import os
+import socket
+from datetime import date as dt_date
+
+from expense_core.feed_cache import LATEST_TTL, FeedCache, RateLimiter
+from expense_core.rates import parse_daily_txt
+
+TODAY = dt_date(2025, 3, 10)
+ERROR_PAGE = "<html>Service temporarily unavailable</html>"
+
+
+class FakeClock:
+    def __init__(self, now: float = 1_000_000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _cache(tmp_path, base_url, clock=None):
+    return FeedCache(str(tmp_path), base_url, clock=clock or FakeClock(), today=lambda: TODAY,
+                     limiter=RateLimiter(0))
+
+
+def _statuses(server) -> list:
+    return [status for _, status in server.log]
+
+
+def _dead_url() -> str:
+    # A port nothing listens on: connecting fails like a network outage
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        port = s.getsockname()[1]
+    return f"http://127.0.0.1:{port}/"
+
+
+def test_latest_waits_out_ttl_then_revalidates(tmp_path, standin):
+    server, url = standin
+    clock = FakeClock()
+    feeds = _cache(tmp_path, url, clock)
+    first = feeds.latest()
+    assert parse_daily_txt(first)[0] is not None
+    clock.now += LATEST_TTL - 1
+    assert feeds.latest() == first
+    assert _statuses(server) == [200]
+    # Past the TTL the ETag is sent and an unchanged feed costs a 304
+    clock.now += 2
+    assert feeds.latest() == first
+    assert _statuses(server) == [200, 304]
+    # refresh=True revalidates at once
+    assert feeds.latest(refresh=True) == first
+    assert _statuses(server) == [200, 304, 304]
+
+
+def test_past_days_and_years_are_final(tmp_path, standin):
+    server, url = standin
+    clock = FakeClock()
+    feeds = _cache(tmp_path, url, clock)
+    past = feeds.daily(dt_date(2025, 3, 7))
+    assert past.startswith("07.03.2025")
+    assert feeds.yearly(2024).startswith("Datum|")
+    clock.now += 10 * LATEST_TTL
+    assert feeds.daily(dt_date(2025, 3, 7)) == past
+    feeds.yearly(2024)
+    assert server.hits == 2
+    assert not any(name.endswith(".meta.json") for _, _, files in os.walk(tmp_path) for name in files)
+
+
+def test_today_and_current_year_are_revalidated(tmp_path, standin):
+    server, url = standin
+    clock = FakeClock()
+    feeds = _cache(tmp_path, url, clock)
+    today = feeds.daily(TODAY)
+    assert today.startswith("10.03.2025")
+    feeds.yearly(TODAY.year)
+    clock.now += LATEST_TTL + 1
+    assert feeds.daily(TODAY) == today
+    feeds.yearly(TODAY.year)
+    assert _statuses(server) == [200, 200, 304, 304]
+
+
+def test_network_failure_falls_back_to_cache(tmp_path, standin):
+    _, url = standin
+    cached = _cache(tmp_path, url).latest()
+    offline = _cache(tmp_path, _dead_url())
+    assert offline.latest(refresh=True) == cached
+    # Nothing on disk and no network: no feed
+    assert offline.daily(dt_date(2025, 3, 7)) is None
+
+
+def test_error_status_falls_back_to_cache(tmp_path, standin):
+    server, url = standin
+    clock = FakeClock()
+    feeds = _cache(tmp_path, url, clock)
+    cached = feeds.yearly(TODAY.year)
+    server.fail = (503, ERROR_PAGE)
+    clock.now += LATEST_TTL + 1
+    assert feeds.yearly(TODAY.year) == cached
+    assert feeds.yearly(2024) is None
+
+
+def test_error_page_with_200_is_not_stored(tmp_path, standin):
+    server, url = standin
+    feeds = _cache(tmp_path, url)
+    server.fail = (200, ERROR_PAGE)
+    assert feeds.yearly(2024) is None
+    assert feeds.daily(dt_date(2025, 3, 7)) is None
+    assert not os.path.exists(tmp_path / "year" / "2024.txt")
+    # Once the server recovers the past year is fetched and kept
+    server.fail = None
+    assert feeds.yearly(2024).startswith("Datum|")
+    assert feeds.daily(dt_date(2025, 3, 7)).startswith("07.03.2025")
+    assert _statuses(server) == [200, 200, 200, 200]
+
+
+def test_stored_error_page_is_refetched(tmp_path, standin):
+    server, url = standin
+    feeds = _cache(tmp_path, url)
+    (tmp_path / "year" / "2024.txt").write_text(ERROR_PAGE, encoding="utf-8")
+    assert feeds.yearly(2024).startswith("Datum|")
+    assert server.hits == 1
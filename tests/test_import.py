@@ -0,0 +1,68 @@
+import io
+
+import pandas as pd
+import pytest
+
+from expense_core.aggregates import CategoryStats
+from expense_core.export import drop_incomplete, export_bytes, read_ledger
+from expense_core.rollup import RollupCube
+from expense_core.storage import ExpenseStore
+
+pa = pytest.importorskip("pyarrow")
+
+
+@pytest.fixture
+def frame() -> pd.DataFrame:
+    return pd.DataFrame({
+        "Date": pd.to_datetime(["2024-01-02", "2024-01-03", "2024-02-01"]),
+        "Country": ["Česko", "Německo", "Německo"],
+        "Currency": ["CZK", "EUR", "EUR"],
+        "Amount": [100.0, 10.0, 20.0],
+        "Category": ["Food", "Food", "Fun"],
+        "Shop": ["a", "b", "c"],
+        "Note": [None, None, None],
+        "Converted_CZK": [100.0, 247.25, 494.5],
+        "Rate_value": [1.0, 24.725, 24.725],
+        "Rate_date": pd.to_datetime(["2024-01-02", "2024-01-02", "2024-02-01"]),
+    })
+
+
+@pytest.mark.parametrize("fmt", ["parquet", "arrow"])
+def test_round_trip(frame, fmt):
+    rows = read_ledger(export_bytes(frame, fmt), fmt)
+    assert list(rows.columns) == list(frame.columns)
+    assert rows["Converted_CZK"].tolist() == frame["Converted_CZK"].tolist()
+
+
+def test_missing_column_is_value_error(frame):
+    import pyarrow.parquet as pq
+    buf = io.BytesIO()
+    pq.write_table(pa.Table.from_pandas(frame.drop(columns=["Category"])), buf)
+    with pytest.raises(ValueError, match="Category"):
+        read_ledger(buf.getvalue(), "parquet")
+
+
+def test_unreadable_file_is_value_error():
+    with pytest.raises(ValueError):
+        read_ledger(b"not an arrow file", "arrow")
+
+
+def test_drop_incomplete(frame):
+    frame.loc[1, "Converted_CZK"] = None
+    frame.loc[2, "Date"] = None
+    rows, skipped = drop_incomplete(read_ledger(export_bytes(frame, "parquet"), "parquet"))
+    assert skipped == 2
+    assert rows["Shop"].tolist() == ["a"]
+
+
+def test_seeds_skip_rows_without_conversion(frame):
+    frame.loc[1, "Converted_CZK"] = None
+    store = ExpenseStore()
+    store.insert_many(frame.to_dict("records"))
+    stats, cube = CategoryStats(), RollupCube()
+    for row in store.category_stats().itertuples(index=False):
+        stats.merge(*row)
+    for row in store.rollup().itertuples(index=False):
+        cube.merge(*row)
+    assert (stats.count, stats.total) == (2, 594.5)
+    assert cube.total() == 594.5
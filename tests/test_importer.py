@@ -0,0 +1,78 @@
+from datetime import date as dt_date
+
+import pandas as pd
+import pytest
+
+from expense_core.importer import convert_to_czk
+from expense_core.rates import RateHistory
+
+TODAY = dt_date(2026, 10, 17)
+
+
+def _frame(*days) -> pd.DataFrame:
+    return pd.DataFrame({
+        "Date": pd.to_datetime(list(days)),
+        "Country": ["Německo"] * len(days),
+        "Currency": ["EUR"] * len(days),
+        "Amount": [10.0] * len(days),
+        "Category": ["Food"] * len(days),
+        "Shop": [""] * len(days),
+        "Note": [""] * len(days),
+    })
+
+
+@pytest.fixture
+def gapped() -> RateHistory:
+    # Rates on both sides of 2025, none inside it
+    rates = RateHistory()
+    rates.add(dt_date(2024, 3, 1), {"EUR": (25.0, 1.0)})
+    rates.add(dt_date(2026, 10, 1), {"EUR": (24.5, 1.0)})
+    return rates
+
+
+def _yearly_2025(yearly_txt):
+    def fetch_year(year):
+        calls.append(year)
+        return yearly_txt.replace(".2024|", ".2025|") if year == 2025 else None
+    calls = []
+    return fetch_year, calls
+
+
+def test_unloaded_year_is_fetched(gapped, yearly_txt):
+    fetch_year, calls = _yearly_2025(yearly_txt)
+    out, skipped = convert_to_czk(_frame("2025-06-03"), gapped, fetch_year=fetch_year, today=TODAY,
+                                  years={2024, 2026})
+    assert calls == [2025]
+    assert skipped == 0
+    assert out["Rate_date"].tolist() == [pd.Timestamp("2025-06-03")]
+
+
+def test_failed_year_falls_back_to_daily_feeds(gapped, daily_txt):
+    fetched = []
+
+    def fetch_days(days):
+        fetched.extend(days)
+        return [f"{d:%d.%m.%Y}" + daily_txt[10:] for d in days]
+
+    out, skipped = convert_to_czk(_frame("2025-06-03", "2025-06-03", "2024-06-03"), gapped,
+                                  fetch_year=lambda year: None, fetch_days=fetch_days, today=TODAY,
+                                  years={2024, 2026})
+    # Once per day, and only for the year that is not loaded
+    assert fetched == [dt_date(2025, 6, 3)]
+    assert skipped == 0
+    assert out["Rate_value"].tolist()[:2] == [24.685, 24.685]
+    assert out["Rate_date"].tolist()[2] == pd.Timestamp("2024-03-01")
+
+
+def test_early_january_needs_previous_year(gapped, yearly_txt):
+    # 01.01.2025 is converted at the last 2024 fixing
+    fetch_year, calls = _yearly_2025(yearly_txt)
+    convert_to_czk(_frame("2025-01-01"), gapped, fetch_year=fetch_year, today=TODAY, years={2025, 2026})
+    assert calls == [2024]
+
+
+def test_without_years_the_history_is_trusted(gapped, yearly_txt):
+    fetch_year, calls = _yearly_2025(yearly_txt)
+    out, _ = convert_to_czk(_frame("2025-06-03"), gapped, fetch_year=fetch_year, today=TODAY)
+    assert calls == []
+    assert out["Rate_date"].tolist() == [pd.Timestamp("2024-03-01")]
@@ -0,0 +1,40 @@
+from datetime import date as dt_date
+
+import pandas as pd
+
+from expense_core.importer import convert_to_czk
+from expense_core.ledger import Ledger
+from expense_core.money import convert_amount, round_amount
+from expense_core.rates import RateHistory
+
+
+def test_round_amount_uses_currency_scale():
+    assert round_amount([100.5, 100.4], "JPY").tolist() == [101.0, 100.0]
+    assert round_amount([10.005, 10.004], "EUR").tolist() == [10.01, 10.0]
+
+
+def test_convert_amount_whole_yen():
+    # 101 JPY at 15.8 CZK / 100 JPY
+    assert convert_amount(100.5, "JPY", 15.8, 100) == convert_amount(101, "JPY", 15.8, 100) == 15.96
+
+
+def test_bulk_amount_matches_conversion(yearly_txt):
+    rates = RateHistory()
+    rates.add_yearly(yearly_txt)
+    frame = pd.DataFrame({
+        "Date": pd.to_datetime(["2024-01-02", "2024-01-02"]),
+        "Country": ["Japonsko", "Německo"],
+        "Currency": ["JPY", "EUR"],
+        "Amount": [100.5, 10.005],
+        "Category": ["Food", "Food"],
+        "Shop": ["", ""],
+        "Note": ["", ""],
+    })
+    out, skipped = convert_to_czk(frame, rates, today=dt_date(2025, 1, 1))
+    assert skipped == 0
+    assert out["Amount"].tolist() == [101.0, 10.01]
+    assert out["Converted_CZK"].tolist() == [convert_amount(101, "JPY", 15.8, 100),
+                                             convert_amount(10.01, "EUR", 24.685, 1)]
+    ledger = Ledger()
+    ledger.extend(out)
+    assert ledger.to_frame()["Amount"].tolist() == [101.0, 10.01]
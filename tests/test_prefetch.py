@@ -0,0 +1,90 @@
+import threading
+import time
+from datetime import date as dt_date, timedelta
+
+import pandas as pd
+
+from expense_core.feed_cache import FeedCache, RateLimiter
+from expense_core.importer import convert_to_czk
+from expense_core.prefetch import RatePrefetcher
+from expense_core.rates import RateHistory
+
+TODAY = dt_date(2025, 3, 10)
+DAYS = [d for d in (dt_date(2025, 2, 3) + timedelta(days=i) for i in range(28)) if d.weekday() < 5]   # 20 business days
+LATENCY = 0.05          # seconds per answer, like a remote server
+RATE = 100              # limiter: at most 100 request starts per second
+
+
+class TrackingSession:
+    """requests session that adds latency and records request starts and concurrency."""
+
+    def __init__(self):
+        import requests
+        self._session = requests.Session()
+        self._lock = threading.Lock()
+        self.active = 0
+        self.peak = 0
+        self.starts = []
+
+    def get(self, url, **kwargs):
+        with self._lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+            self.starts.append(time.monotonic())
+        try:
+            time.sleep(LATENCY)
+            return self._session.get(url, **kwargs)
+        finally:
+            with self._lock:
+                self.active -= 1
+
+
+def _frame() -> pd.DataFrame:
+    n = len(DAYS)
+    return pd.DataFrame({
+        "Date": pd.to_datetime(DAYS),
+        "Country": ["Německo"] * n,
+        "Currency": ["EUR"] * n,
+        "Amount": [10.0] * n,
+        "Category": ["Food"] * n,
+        "Shop": [""] * n,
+        "Note": [""] * n,
+    })
+
+
+def _feeds(tmp_path, url, session) -> FeedCache:
+    return FeedCache(str(tmp_path), url, session=session, today=lambda: TODAY, limiter=RateLimiter(RATE))
+
+
+def test_import_backfill_is_concurrent_and_limited(tmp_path, standin):
+    server, url = standin
+    session = TrackingSession()
+    prefetcher = RatePrefetcher(_feeds(tmp_path, url, session), workers=4)
+    rates = RateHistory()
+
+    begin = time.monotonic()
+    out, skipped = convert_to_czk(_frame(), rates, fetch_days=prefetcher.fetch_days, today=TODAY)
+    assert skipped == 0
+    assert out["Rate_date"].tolist() == [pd.Timestamp(d) for d in DAYS]
+    assert server.hits == len(DAYS)
+    # Several requests in flight, never more than the pool
+    assert 1 < session.peak <= 4
+    # The limiter spaces request starts 1/RATE apart
+    assert max(session.starts) - begin >= (len(DAYS) - 1) / RATE
+
+    # A second pass finds nothing missing
+    convert_to_czk(_frame(), rates, fetch_days=prefetcher.fetch_days, today=TODAY)
+    assert server.hits == len(DAYS)
+    # A fresh history reads the past days from disk
+    convert_to_czk(_frame(), RateHistory(), fetch_days=prefetcher.fetch_days, today=TODAY)
+    assert server.hits == len(DAYS)
+
+
+def test_fetch_days_keeps_order_and_failures(tmp_path, standin):
+    server, url = standin
+    prefetcher = RatePrefetcher(_feeds(tmp_path, url, TrackingSession()))
+    server.fail = (503, "down")
+    assert prefetcher.fetch_days(DAYS[:3]) == [None, None, None]
+    server.fail = None
+    texts = prefetcher.fetch_days(DAYS[:3])
+    assert [t[:10] for t in texts] == [f"{d:%d.%m.%Y}" for d in DAYS[:3]]
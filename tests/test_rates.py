@@ -0,0 +1,128 @@
+from datetime import date as dt_date
+
+import pytest
+
+from expense_core.holidays import builtin_year, easter_sunday, is_easter
+from expense_core.rates import RateHistory, parse_daily_txt, parse_rate_from_txt, parse_yearly_txt
+
+
+# ---------------------------
+# Feed parsing
+# ---------------------------
+def test_parse_daily_txt(daily_txt):
+    day, rates = parse_daily_txt(daily_txt)
+    assert day == dt_date(2024, 1, 2)
+    assert len(rates) == 31
+    assert rates["EUR"] == (24.685, 1.0)
+    assert rates["JPY"] == (15.8, 100.0)
+    assert rates["IDR"] == (1.449, 1000.0)
+
+
+def test_parse_daily_txt_rejects_garbage():
+    assert parse_daily_txt("") == (None, {})
+    assert parse_daily_txt("<html>502 Bad Gateway</html>") == (None, {})
+
+
+def test_parse_rate_from_txt(daily_txt):
+    assert parse_rate_from_txt(daily_txt, "EUR") == (24.685, 1.0, "02.01.2024")
+    assert parse_rate_from_txt(daily_txt, "XYZ") == (None, None, "02.01.2024")
+
+
+def test_parse_yearly_txt(yearly_txt):
+    rows = list(parse_yearly_txt(yearly_txt))
+    assert len(rows) == 252
+    day, rates = rows[0]
+    assert day == dt_date(2024, 1, 2)
+    assert rates["EUR"] == (24.685, 1.0)
+    assert rates["JPY"] == (15.8, 100.0)
+    assert rates["IDR"] == (1.449, 1000.0)
+
+
+def test_parse_yearly_txt_header_repeated_mid_file(yearly_txt):
+    # CNB repeats the header when the currency set changes within a year
+    header, first, second, *_ = yearly_txt.splitlines()
+    txt = "\n".join([header, first, "Datum|1 EUR|100 JPY|1 XYZ", "03.01.2024|24,000|15,600|2,500", ""])
+    rows = list(parse_yearly_txt(txt))
+    assert [day for day, _ in rows] == [dt_date(2024, 1, 2), dt_date(2024, 1, 3)]
+    assert rows[1][1] == {"EUR": (24.0, 1.0), "JPY": (15.6, 100.0), "XYZ": (2.5, 1.0)}
+
+
+# ---------------------------
+# As-of lookups
+# ---------------------------
+@pytest.fixture(scope="module")
+def history(yearly_txt):
+    rates = RateHistory()
+    rates.add_yearly(yearly_txt)
+    return rates
+
+
+def test_as_of_business_day(history):
+    assert history.as_of("EUR", dt_date(2024, 1, 5)) == (24.023, 1.0, dt_date(2024, 1, 5))
+
+
+def test_as_of_weekend_uses_friday(history):
+    for d in (dt_date(2024, 1, 6), dt_date(2024, 1, 7)):
+        assert history.as_of("EUR", d) == (24.023, 1.0, dt_date(2024, 1, 5))
+
+
+def test_as_of_easter_uses_last_business_day(history):
+    # Good Friday 29.03 and Easter Monday 01.04.2024 are not fixing days
+    for d in (dt_date(2024, 3, 29), dt_date(2024, 3, 31), dt_date(2024, 4, 1)):
+        assert history.as_of("EUR", d) == (25.205, 1.0, dt_date(2024, 3, 28))
+
+
+def test_as_of_before_first_rate(history):
+    assert history.as_of("EUR", dt_date(2024, 1, 1)) == (None, None, None)
+    assert history.as_of("XYZ", dt_date(2024, 6, 1)) == (None, None, None)
+
+
+def test_as_of_hundred_unit_qty(history):
+    rate, qty, day = history.as_of("JPY", dt_date(2024, 1, 2))
+    assert (rate, qty, day) == (15.8, 100.0, dt_date(2024, 1, 2))
+    assert round(10_000 * rate / qty, 2) == 1580.0
+
+
+def test_add_daily_extends_history(history, daily_txt):
+    rates = RateHistory()
+    assert rates.add_daily(daily_txt) == dt_date(2024, 1, 2)
+    assert rates.latest == dt_date(2024, 1, 2)
+    assert rates.as_of("EUR", dt_date(2024, 1, 3)) == (24.685, 1.0, dt_date(2024, 1, 2))
+
+
+# ---------------------------
+# Built-in holidays
+# ---------------------------
+@pytest.mark.parametrize("year, sunday", [
+    (2000, dt_date(2000, 4, 23)),
+    (2019, dt_date(2019, 4, 21)),
+    (2024, dt_date(2024, 3, 31)),
+    (2025, dt_date(2025, 4, 20)),
+    (2038, dt_date(2038, 4, 25)),   # latest possible
+    (2285, dt_date(2285, 3, 22)),   # earliest possible
+])
+def test_easter_sunday(year, sunday):
+    assert easter_sunday(year) == sunday
+
+
+def test_is_easter_window():
+    assert [is_easter(dt_date(2024, 3, d)) for d in (28, 29, 30, 31)] == [False, True, True, True]
+    assert is_easter(dt_date(2024, 4, 1)) and not is_easter(dt_date(2024, 4, 2))
+
+
+def test_builtin_year_cz():
+    days = builtin_year("CZ", 2024)
+    assert len(days) == 13
+    assert [h["name"] for h in days["2024-03-29"]] == ["Velký pátek"]
+    assert [h["name"] for h in days["2024-04-01"]] == ["Velikonoční pondělí"]
+    assert days["2024-07-06"][0]["date"]["iso"] == "2024-07-06"
+    # Good Friday is a Czech holiday only since 2016
+    assert "2015-04-03" not in builtin_year("CZ", 2015)
+    assert "2015-04-06" in builtin_year("CZ", 2015)
+
+
+def test_builtin_year_sk():
+    days = builtin_year("SK", 2025)
+    assert len(days) == 15
+    assert days["2025-04-18"][0]["name"] == "Veľký piatok"
+    assert days["2025-08-29"][0]["date"]["iso"] == "2025-08-29"
@@ -0,0 +1,121 @@
+from datetime import date as dt_date, datetime, timedelta, timezone
+
+import pytest
+
+from expense_core.rates import RateHistory
+from expense_core.warmup import PRAGUE, RETRY, RateWarmer, fixing_on_or_before, last_fixing, next_refresh
+
+
+class FakeClock:
+    def __init__(self, now: datetime):
+        self.now = now
+
+    def __call__(self) -> datetime:
+        return self.now
+
+
+class FakeFeeds:
+    """FeedCache stand-in over the sample feeds; years in `down` answer like a failed fetch."""
+
+    def __init__(self, daily_txt: str, yearly_txt: str, clock: FakeClock, down=()):
+        self.daily_txt = daily_txt
+        self.yearly_txt = yearly_txt
+        self.clock = clock
+        self.down = set(down)
+        self.calls = []
+
+    def yearly(self, year: int):
+        self.calls.append(("yearly", year))
+        if year in self.down:
+            return None
+        # The 2024 rows re-dated (weekdays stay 2024's); 29.02 of other years is skipped
+        return self.yearly_txt.replace(".2024|", f".{year}|")
+
+    def daily(self, d: dt_date):
+        self.calls.append(("daily", d))
+        return f"{fixing_on_or_before(d):%d.%m.%Y}" + self.daily_txt[10:]
+
+    def latest(self, refresh: bool = False):
+        self.calls.append(("latest", refresh))
+        return f"{last_fixing(self.clock()):%d.%m.%Y}" + self.daily_txt[10:]
+
+
+def _warmer(daily_txt, yearly_txt, now, down=()):
+    clock = FakeClock(now)
+    feeds = FakeFeeds(daily_txt, yearly_txt, clock, down)
+    return RateWarmer(feeds, RateHistory(), since=2024, clock=clock), feeds, clock
+
+
+# Monday 10.03.2025, 15:00 Prague: that day's fixing is out
+NOW = datetime(2025, 3, 10, 15, 0, tzinfo=PRAGUE).astimezone(timezone.utc)
+
+
+def test_schedule():
+    assert last_fixing(datetime(2025, 3, 10, 14, 0, tzinfo=PRAGUE)) == dt_date(2025, 3, 7)
+    assert last_fixing(datetime(2025, 3, 10, 14, 31, tzinfo=PRAGUE)) == dt_date(2025, 3, 10)
+    # Friday after the refresh -> Monday; Easter Monday 21.04.2025 is no fixing day
+    assert next_refresh(datetime(2025, 3, 7, 15, 0, tzinfo=PRAGUE)).date() == dt_date(2025, 3, 10)
+    assert next_refresh(datetime(2025, 4, 18, 12, 0, tzinfo=PRAGUE)).date() == dt_date(2025, 4, 22)
+
+
+def test_load_covers_past_and_latest(daily_txt, yearly_txt):
+    warmer, _, _ = _warmer(daily_txt, yearly_txt, NOW)
+    warmer.load()
+    assert warmer.years == {2024, 2025}
+    assert warmer.ready
+    assert warmer.covers(dt_date(2025, 3, 4)) and warmer.covers(dt_date(2025, 3, 10))
+    assert warmer.rates.as_of("EUR", dt_date(2025, 3, 4))[2] == dt_date(2025, 3, 4)
+    # Up to date: sleep until the next refresh, 14:35 on Tuesday
+    assert warmer.delay() == pytest.approx(timedelta(hours=23, minutes=35).total_seconds())
+
+
+def test_failed_year_is_not_covered_and_retried(daily_txt, yearly_txt):
+    warmer, feeds, clock = _warmer(daily_txt, yearly_txt, NOW, down={2025})
+    warmer.load()
+    # The latest feed alone must not make the rest of 2025 look covered
+    assert warmer.ready
+    assert warmer.years == {2024}
+    assert not warmer.covers(dt_date(2025, 3, 4))
+    assert warmer.covers(dt_date(2024, 6, 3))
+    # Without the retry a save would get the stale 31.12.2024 rate
+    assert warmer.rates.as_of("EUR", dt_date(2025, 3, 4))[2] == dt_date(2024, 12, 31)
+    assert warmer.delay() == RETRY
+
+    # The scheduler wakes after RETRY seconds; CNB is back by then
+    waits = []
+
+    def wait(seconds):
+        waits.append(seconds)
+        clock.now += timedelta(seconds=seconds)
+        feeds.down.clear()
+        return len(waits) > 1
+
+    warmer._wait = wait
+    warmer.run()
+    assert waits[0] == RETRY
+    assert warmer.years == {2024, 2025}
+    assert warmer.covers(dt_date(2025, 3, 4))
+    assert warmer.rates.as_of("EUR", dt_date(2025, 3, 4))[2] == dt_date(2025, 3, 4)
+    assert feeds.calls.count(("yearly", 2025)) == 3
+    assert feeds.calls.count(("yearly", 2024)) == 1
+
+
+def test_not_covered_before_load(daily_txt, yearly_txt):
+    warmer, _, _ = _warmer(daily_txt, yearly_txt, NOW)
+    assert warmer.as_of is None
+    assert not warmer.covers(dt_date(2024, 6, 3))
+    assert warmer.delay() == RETRY
+
+
+def test_rate_for_fetches_only_what_is_not_covered(daily_txt, yearly_txt):
+    warmer, feeds, _ = _warmer(daily_txt, yearly_txt, NOW, down={2025})
+    warmer.load()
+    assert warmer.rate_for("CZK", dt_date(2025, 3, 4)) == (1.0, 1, "2025-03-04")
+    # Covered: answered from the history
+    assert warmer.rate_for("EUR", dt_date(2024, 6, 3))[2] == "2024-06-03"
+    assert not [c for c in feeds.calls if c[0] == "daily"]
+    # 2025 is not loaded: the day is fetched instead of using the 31.12.2024 rate
+    assert warmer.rate_for("EUR", dt_date(2025, 3, 4)) == (24.685, 1.0, "2025-03-04")
+    # A code the warmed-up history lacks is fetched before giving up
+    assert warmer.rate_for("XYZ", dt_date(2024, 6, 3)) == (None, None, None)
+    assert [c for c in feeds.calls if c[0] == "daily"] == [("daily", dt_date(2025, 3, 4)), ("daily", dt_date(2024, 6, 3))]
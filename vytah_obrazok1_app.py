@@ -1,7 +1,8 @@
 import streamlit as st
-from PIL import Image
 import datetime
 
+from expense_core.assets import picture
+
 # Nastavenie názvu stránky
 st.set_page_config(page_title="Výdavkový denník – Výtahový mód", page_icon="🧾")
 
@@ -9,8 +10,9 @@ st.set_page_config(page_title="Výdavkový denník – Výtahový mód", page_ic
 st.markdown("## 🧾 Výdavkový denník – Výtahový mód")
 
 # Zobrazenie obrázku č. 1 – výťah so zatvorenými dverami
-obrazok = Image.open("images_vytah_appka/vytah_zavrete_dvere_obrazok1.png")
-st.image(obrazok, caption="Obrázok č. 1 – Začiatok cesty výťahom", use_column_width=True)
+# (zmenšené varianty zo static/, prehliadač si ich pamätá medzi prekresleniami)
+st.markdown(picture("vytah_zavrete_dvere_obrazok1.png", "Výťah so zatvorenými dverami"), unsafe_allow_html=True)
+st.caption("Obrázok č. 1 – Začiatok cesty výťahom")
 
 # Rozdelenie obrazovky na 2 stĺpce, aby boli kalendár a jazyk vedľa seba
 col1, col2 = st.columns(2)